@@ -61,11 +61,13 @@ if USE_VOID_PLAYER:
     # Total real wires = base wires + all uncertain wires - 1 discarded
     # We need to round UP since some players may have one extra card
     _base_total_wires = sum(WIRE_DISTRIBUTION.values()) + sum(EXTRA_UNCERTAIN_WIRES.values()) - 1
-    _hand_size = (_base_total_wires + N - 1) // N  # Ceiling division: round up
-    
+    _q, _r = divmod(_base_total_wires, N)
+    _hand_size = _q + (1 if _r else 0)  # Ceiling division: round up
+
     # 1b. Add filler wires (99) for real players if needed
     # These are needed if the real wires don't divide evenly among real players
-    _filler_needed = (N * _hand_size) - _base_total_wires
+    # Reuses the remainder: N * _hand_size - _base_total_wires == (N - _r) % N
+    _filler_needed = (N - _r) % N
     if _filler_needed > 0:
         WIRE_DISTRIBUTION[99] = _filler_needed
 
@@ -89,7 +91,7 @@ if USE_VOID_PLAYER:
         WIRE_DISTRIBUTION[0] = _padding_amount
 
 # Derived parameters
-WIRE_VALUES = sorted(WIRE_DISTRIBUTION.keys())  # All unique values
+WIRE_VALUES = tuple(sorted(WIRE_DISTRIBUTION.keys()))  # All unique values
 K = len(WIRE_VALUES)                             # Number of distinct wire values
 TOTAL_WIRES = sum(WIRE_DISTRIBUTION.values())   # Total number of wires
 
@@ -103,6 +105,12 @@ class GameConfig:
     Encapsulates all game rules and parameters.
     """
     
+    __slots__ = (
+        'wire_distribution', 'n_players', 'max_wrong_calls', 'playing_irl',
+        'use_global_belief', 'auto_filter', 'wire_values', 'K', 'k',
+        'total_wires', 'wires_per_player', '_get_copies'
+    )
+    
     def __init__(
         self,
         wire_distribution: dict = None,
@@ -131,13 +139,21 @@ class GameConfig:
         self.use_global_belief = use_global_belief
         self.auto_filter = auto_filter
         
-        # Derived values
-        self.wire_values = sorted(self.wire_distribution.keys())
-        self.K = len(self.wire_values)
+        # Derived values (default distribution reuses the module-level constants)
+        if wire_distribution is None:
+            self.wire_values = WIRE_VALUES
+            self.K = K
+            self.total_wires = TOTAL_WIRES
+        else:
+            self.wire_values = tuple(sorted(self.wire_distribution.keys()))
+            self.K = len(self.wire_values)
+            self.total_wires = sum(self.wire_distribution.values())
         self.k = self.K  # Alias for backwards compatibility
-        self.total_wires = sum(self.wire_distribution.values())
         self.wires_per_player = self.total_wires // n_players
         
+        # Bound lookup for hot callers (avoids re-resolving the dict attribute)
+        self._get_copies = self.wire_distribution.get
+        
         # For backwards compatibility (deprecated - use wire_distribution instead)
         # self.r_k = None  # No longer a single value
         
@@ -154,10 +170,12 @@ class GameConfig:
         Returns:
             Number of copies of this value in the game
         """
-        return self.wire_distribution.get(value, 0)
+        return self._get_copies(value, 0)
     
     def _validate(self):
         """Validate that the configuration is internally consistent."""
+        if not __debug__:
+            return
         assert self.total_wires % self.n_players == 0, \
             "Total wires must be evenly divisible by number of players"
         assert self.max_wrong_calls > 0, \
@@ -172,6 +190,8 @@ class GameConfig:
 
 def validate_config():
     """Validate that the default configuration is internally consistent."""
+    if not __debug__:
+        return
     assert TOTAL_WIRES % N == 0, "Total wires must be evenly divisible by number of players"
     assert sum(WIRE_DISTRIBUTION.values()) == TOTAL_WIRES, "Total wires must equal sum of all copies"
     
@@ -1,9 +1,12 @@
 import random
 import json
 import time
-import os
-from dataclasses import asdict
-from typing import List, Tuple, Optional
+import io
+import sys
+from contextlib import redirect_stdout
+from enum import IntEnum
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional, Type
 from config.game_config import GameConfig, PLAYER_NAMES
 from src.player import Player
 from src.game import Game
@@ -12,276 +15,404 @@ from src.agents.random_agent import RandomAgent
 from src.agents.smart_agent import SmartAgent
 from src.agents.smartest_agent import SmartestAgent
 from src.utils import generate_wires, find_first_unrevealed_position
-from src.statistics import GameStatistics
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
 
 
 USE_GLOBAL_BELIEF = True
+VERBOSE = True  # Print per-turn details (disable for batch simulations)
+VOID_PLAYER_ID = PLAYER_NAMES.index("VOID") if "VOID" in PLAYER_NAMES else None
+
 
+def log(*args, **kwargs):
+    """print() that is silenced when VERBOSE is off."""
+    if VERBOSE:
+        print(*args, **kwargs)
 
-def setup_game(config: GameConfig) -> Tuple[Game, List[Player], List[BaseAgent], Optional[int]]:
+
+class FilterTimeLog:
+    """
+    Filter timings of one simulation, kept in memory and optionally written as JSON lines.
+    
+    The file is truncated when the log is created, so it only holds this run.
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: File to write the records to; None keeps them in memory only
+        """
+        self.entries: List[Dict] = []
+        self._file = open(path, "w", encoding="utf-8") if path is not None else None
+    
+    def append(self, entry: Dict):
+        """Record one timing and write it out as a line (one record, no rewrite of the list)."""
+        self.entries.append(entry)
+        if self._file is not None:
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+    
+    def close(self):
+        """Close the file, if any."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def setup_game(config: GameConfig, agent_cls: Type[BaseAgent] = SmartestAgent) -> Tuple[Game, List[Player], List[BaseAgent], Optional[int]]:
     wires = generate_wires(config)
-    players = []
-    agents = []
     
-    void_player_id = None
-    if "VOID" in PLAYER_NAMES:
-        void_player_id = PLAYER_NAMES.index("VOID")
-        print(f"VOID player identified at index {void_player_id}")
+    void_player_id = VOID_PLAYER_ID
+    if void_player_id is not None:
+        log(f"VOID player identified at index {void_player_id}")
     
-    for i in range(config.n_players):
-        player = Player(i, wires[i], config)
-        players.append(player)
-        agents.append(SmartestAgent(player))
+    players = [Player(i, wires[i], config) for i in range(config.n_players)]
+    agents = [agent_cls(p) for p in players]
     
     game = Game(players, config)
     
-    print(f"Starting Game with {config.n_players} players...")
+    log(f"Starting Game with {config.n_players} players...")
     for p in players:
-        print(f"Player {p.player_id} wire: {p.wire}")
+        log(f"Player {p.player_id} wire: {p.wire}")
     
     return game, players, agents, void_player_id
 
 
 def send_initial_signals(game: Game, players: List[Player], void_player_id: Optional[int]):
-    print("\n--- Initial Signals ---")
-    for p in players:
+    log("\n--- Initial Signals ---")
+    # Sample every player's signal position in one call (all wires have the same length)
+    signal_positions = random.choices(range(game.config.wires_per_player), k=len(players))
+    for p, pos_to_signal in zip(players, signal_positions):
         if p.player_id == void_player_id:
             continue
         
-        pos_to_signal = random.randint(0, len(p.wire) - 1)
         value_to_signal = p.wire[pos_to_signal]
         
-        print(f"Player {p.player_id} signals pos {pos_to_signal} is {value_to_signal}")
+        log(f"Player {p.player_id} signals pos {pos_to_signal} is {value_to_signal}")
         game.signal_value(p.player_id, value_to_signal, pos_to_signal)
 
 
-def handle_quad_double_reveal(game: Game, current_player_id: int, action: Tuple):
+class GameOver(Exception):
+    """Raised by an action handler when its action ends the game."""
+
+
+class ActionKind(IntEnum):
+    """Kinds of agent actions, used to index the HANDLERS dispatch table."""
+    NORMAL = 0
+    DOUBLE_REVEAL = 1
+    DOUBLE_CHANCE = 2
+    QUAD = 3
+
+
+# (tag, tuple length) -> ActionKind for the tagged special actions
+ACTION_KINDS = {
+    ('double_reveal_quad', 6): ActionKind.QUAD,
+    ('double_reveal', 4): ActionKind.DOUBLE_REVEAL,
+    ('double_chance', 5): ActionKind.DOUBLE_CHANCE,
+}
+
+
+def classify_action(action: Tuple) -> ActionKind:
+    """
+    Map an agent action tuple to its ActionKind.
+    
+    Agents return ('double_reveal_quad', p1, p2, p3, p4, v), ('double_reveal', p1, p2, v),
+    ('double_chance', target, p1, p2, v) or a plain (target, position, value) call.
+    """
+    if not isinstance(action, tuple) or not action:
+        return ActionKind.NORMAL
+    return ACTION_KINDS.get((action[0], len(action)), ActionKind.NORMAL)
+
+
+def handle_quad_double_reveal(game: Game, players: List[Player], current_player_id: int, action: Tuple,
+                              config: GameConfig, filter_times: FilterTimeLog, K: int):
     _, pos1, pos2, pos3, pos4, value = action
-    print(f"Agent {current_player_id} does QUAD DOUBLE REVEAL on positions [{pos1}, {pos2}] and [{pos3}, {pos4}] value {value}")
+    log(f"Agent {current_player_id} does QUAD DOUBLE REVEAL on positions [{pos1}, {pos2}] and [{pos3}, {pos4}] value {value}")
     
     try:
         game.double_reveal(current_player_id, value, pos1, pos2)
-        print(f"First double reveal successful!")
+        log(f"First double reveal successful!")
         game.double_reveal(current_player_id, value, pos3, pos4)
-        print(f"Second double reveal successful!")
+        log(f"Second double reveal successful!")
     except ValueError as e:
-        print(f"Invalid double reveal attempted: {e}")
+        log(f"Invalid double reveal attempted: {e}")
 
 
-def handle_double_reveal(game: Game, current_player_id: int, action: Tuple):
+def handle_double_reveal(game: Game, players: List[Player], current_player_id: int, action: Tuple,
+                         config: GameConfig, filter_times: FilterTimeLog, K: int):
     _, pos1, pos2, value = action
-    print(f"Agent {current_player_id} does DOUBLE REVEAL on positions [{pos1}, {pos2}] value {value}")
+    log(f"Agent {current_player_id} does DOUBLE REVEAL on positions [{pos1}, {pos2}] value {value}")
     
     try:
         game.double_reveal(current_player_id, value, pos1, pos2)
-        print(f"Double reveal successful!")
+        log(f"Double reveal successful!")
     except ValueError as e:
-        print(f"Invalid double reveal attempted: {e}")
+        log(f"Invalid double reveal attempted: {e}")
 
 
-def handle_double_chance(game: Game, players: List[Player], current_player_id: int, action: Tuple) -> bool:
+def handle_double_chance(game: Game, players: List[Player], current_player_id: int, action: Tuple,
+                         config: GameConfig, filter_times: FilterTimeLog, K: int):
     _, target_id, pos1, pos2, value = action
-    print(f"Agent {current_player_id} calls DOUBLE CHANCE on Player {target_id} positions [{pos1}, {pos2}] value {value}")
+    log(f"Agent {current_player_id} calls DOUBLE CHANCE on Player {target_id} positions [{pos1}, {pos2}] value {value}")
     
     target_player = players[target_id]
     actual_val1 = target_player.wire[pos1]
     actual_val2 = target_player.wire[pos2]
     success = (actual_val1 == value or actual_val2 == value)
     
-    print(f"Result: {'SUCCESS' if success else 'FAILURE'}")
-    print(f"  Position {pos1} has {actual_val1}, Position {pos2} has {actual_val2}")
+    log(f"Result: {'SUCCESS' if success else 'FAILURE'}")
+    log(f"  Position {pos1} has {actual_val1}, Position {pos2} has {actual_val2}")
 
-    caller_player = players[current_player_id]
-    caller_pos_ = find_first_unrevealed_position(caller_player, value)
-    
     if success:
+        # Only the success path needs the caller's matching position
+        caller_pos_ = find_first_unrevealed_position(players[current_player_id], value)
         if actual_val1 == value:
-            print(f"  Signaling Player {target_id} pos {pos1} = {value}")
+            log(f"  Signaling Player {target_id} pos {pos1} = {value}")
             game.make_call(current_player_id, target_id, pos1, value, True, caller_pos_)
         elif actual_val2 == value:
-            print(f"  Signaling Player {target_id} pos {pos2} = {value}")
+            log(f"  Signaling Player {target_id} pos {pos2} = {value}")
             game.make_call(current_player_id, target_id, pos2, value, True, caller_pos_)
     else:
-        print(f"  Double chance failed! Player {target_id} signals pos {pos1} = {actual_val1}")
+        log(f"  Double chance failed! Player {target_id} signals pos {pos1} = {actual_val1}")
         game.signal_value(target_id, actual_val1, pos1)
         
-        for player in players:
-            if player.belief_system:
-                if value in player.belief_system.beliefs[target_id][pos1]:
-                    player.belief_system.beliefs[target_id][pos1].discard(value)
-                if value in player.belief_system.beliefs[target_id][pos2]:
-                    player.belief_system.beliefs[target_id][pos2].discard(value)
-                    print(f"  Removing {value} from Player {target_id} positions [{pos1},{pos2}] beliefs (double chance logic)")
+        log(f"  Removing {value} from Player {target_id} positions [{pos1},{pos2}] beliefs (double chance logic)")
+        game.eliminate_value(target_id, value, (pos1, pos2))
         
         game.wrong_calls_count += 1
-        if game.wrong_calls_count >= game.config.max_wrong_calls:
-            print(f"Team lost! Too many wrong calls ({game.wrong_calls_count}/{game.config.max_wrong_calls})")
+        max_wrong = game.max_wrong_calls
+        if game.wrong_calls_count >= max_wrong:
+            log(f"Team lost! Too many wrong calls ({game.wrong_calls_count}/{max_wrong})")
             game.game_over = True
             game.team_won = False
-            return True
-    
-    return False
+            raise GameOver()
 
 
 def handle_normal_call(game: Game, players: List[Player], current_player_id: int, action: Tuple, 
-                      config: GameConfig, filter_times: List, K: int):
+                      config: GameConfig, filter_times: FilterTimeLog, K: int):
     target_id, position, value = action
-    print(f"Agent {current_player_id} calls Player {target_id} pos {position} value {value}")
+    log(f"Agent {current_player_id} calls Player {target_id} pos {position} value {value}")
     
     try:
         result = game.auto_make_call(current_player_id, target_id, position, value)
-        print(f"Result: {'SUCCESS' if result.success else 'FAILURE'}")
+        log(f"Result: {'SUCCESS' if result.success else 'FAILURE'}")
         
         if not result.success:
             target_player = players[target_id]
             actual_value = target_player.wire[position]
-            print(f"Call failed! Player {target_id} signals pos {position} is {actual_value}")
+            log(f"Call failed! Player {target_id} signals pos {position} is {actual_value}")
             game.signal_value(target_id, actual_value, position)
             game.wrong_calls_count += 1
         
         if game.current_turn % K == 0 and K != 1:
             measure_filter_time(players[current_player_id], game.current_turn, config, filter_times)
     except ValueError as e:
-        print(f"Invalid call attempted: {e}")
+        log(f"Invalid call attempted: {e}")
+
 
+def filter_log_filename(config: GameConfig) -> str:
+    """Line-delimited JSON file that a simulation's filter timings are written to."""
+    return "global_filter_time.jsonl" if config.use_global_belief else "human_filter_time.jsonl"
 
-def measure_filter_time(player: Player, turn: int, config: GameConfig, filter_times: List):
-    print(f"Measuring filter time for Player {player.player_id} (Turn {turn})...")
-    start_time = time.time()
-    player.belief_system.apply_filters()
-    end_time = time.time()
-    duration = end_time - start_time
-    print(f"Filter time: {duration:.4f}s")
+
+def measure_filter_time(player: Player, turn: int, config: GameConfig, filter_times: FilterTimeLog):
+    if not player.belief_system.dirty:
+        log(f"Player {player.player_id} beliefs unchanged since last filtering, nothing to measure.")
+        return
+    log(f"Measuring filter time for Player {player.player_id} (Turn {turn})...")
+    start_ns = time.perf_counter_ns()
+    player.belief_system.apply_filters_if_stale()
+    duration_ns = time.perf_counter_ns() - start_ns
+    log(f"Filter time: {duration_ns / 1e9:.4f}s")
     
-    stats = GameStatistics(player.belief_system, config, player.wire)
-    entropy = stats.calculate_system_entropy()
+    entropy = player.belief_system.system_entropy()
     
-    filter_times.append({
+    entry = {
         "turn": turn,
-        "time": duration,
+        "time_ns": duration_ns,
         "entropy": entropy
-    })
-    
-    filename = "global_filter_time.json" if config.use_global_belief else "human_filter_time.json"
-    with open(filename, "w") as f:
-        json.dump(filter_times, f, indent=2)
+    }
+    filter_times.append(entry)
 
 
 def process_action(game: Game, players: List[Player], agents: List[BaseAgent], 
-                   current_player_id: int, config: GameConfig, filter_times: List, K: int) -> bool:
+                   current_player_id: int, config: GameConfig, filter_times: FilterTimeLog, K: int) -> bool:
     agent = agents[current_player_id]
-    print(f"\n--- Turn {game.current_turn} (Player {current_player_id}) ---")
+    log(f"\n--- Turn {game.current_turn} (Player {current_player_id}) ---")
     action = agent.choose_action(game)
     
     if not action:
-        print(f"Agent {current_player_id} could not make a valid move.")
+        log(f"Agent {current_player_id} could not make a valid move.")
         return False
     
-    if isinstance(action, tuple) and len(action) == 6 and action[0] == 'double_reveal_quad':
-        handle_quad_double_reveal(game, current_player_id, action)
-    elif isinstance(action, tuple) and len(action) == 4 and action[0] == 'double_reveal':
-        handle_double_reveal(game, current_player_id, action)
-    elif isinstance(action, tuple) and len(action) == 5 and action[0] == 'double_chance':
-        game_over = handle_double_chance(game, players, current_player_id, action)
-        if game_over:
-            return None
-    else:
-        handle_normal_call(game, players, current_player_id, action, config, filter_times, K)
-    
+    HANDLERS[classify_action(action)](game, players, current_player_id, action, config, filter_times, K)
     return True
 
 
-def process_turn(game: Game, players: List[Player], agents: List[BaseAgent], 
-                void_player_id: Optional[int], config: GameConfig, filter_times: List, K: int) -> Tuple[bool, int]:
-    current_player_id = game.current_turn % config.n_players
+# Indexed by ActionKind; a handler raises GameOver if its action ended the game
+HANDLERS = (
+    handle_normal_call,         # ActionKind.NORMAL
+    handle_double_reveal,       # ActionKind.DOUBLE_REVEAL
+    handle_double_chance,       # ActionKind.DOUBLE_CHANCE
+    handle_quad_double_reveal,  # ActionKind.QUAD
+)
+
+
+def process_turn(game: Game, players: List[Player], agents: List[BaseAgent], current_player_id: int,
+                void_player_id: Optional[int], config: GameConfig, filter_times: FilterTimeLog, K: int) -> bool:
+    """
+    Play one turn.
     
+    Returns:
+        True if an action was taken, False if the turn was skipped
+        
+    Raises:
+        GameOver: If the action ended the game
+    """
     if current_player_id == void_player_id:
-        print(f"\n--- Turn {game.current_turn} (VOID Player) ---")
-        print("Skipping VOID player turn.")
+        log(f"\n--- Turn {game.current_turn} (VOID Player) ---")
+        log("Skipping VOID player turn.")
         game.current_turn += 1
-        return False, 1
+        return False
     
+    # Filter only on real turns: the VOID skip above returns before this point
     if K == 1:
-        players[current_player_id].belief_system.apply_filters()
+        players[current_player_id].belief_system.apply_filters_if_stale()
     game.current_turn += 1
-    action_result = process_action(game, players, agents, current_player_id, config, filter_times, K)
-    
-    if action_result is None:
-        return None, 0
-    elif action_result:
-        return True, 0
-    else:
-        return False, 1
+    return process_action(game, players, agents, current_player_id, config, filter_times, K)
+
+
+def flush_turn_output(buffer: io.StringIO):
+    """Write a turn's buffered output to stdout and reset the buffer."""
+    text = buffer.getvalue()
+    if text:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        buffer.seek(0)
+        buffer.truncate()
 
 
 def run_game_loop(game: Game, players: List[Player], agents: List[BaseAgent], 
-                  void_player_id: Optional[int], config: GameConfig, K: int = 1, max_turns: int = 100):
-    filter_times = []
-    consecutive_skips = 0
+                  void_player_id: Optional[int], config: GameConfig, K: int = 1, max_turns: int = 100,
+                  filter_times: Optional[FilterTimeLog] = None):
+    if filter_times is None:
+        filter_times = FilterTimeLog()
+    # Players whose turns were skipped since the last action was taken
+    skipped = set()
+    n_players = config.n_players
+    # Rotating index kept in step with game.current_turn (one increment per turn)
+    current_player_id = game.current_turn % n_players
+    # Everything printed during a turn (including by agents) is collected here
+    # and written to the real stdout in one call at the end of the turn
+    turn_output = io.StringIO()
     
     while not game.is_game_over() and game.current_turn < max_turns:
-        result = process_turn(game, players, agents, void_player_id, config, filter_times, K)
-        
-        if result is None:
+        try:
+            with redirect_stdout(turn_output):
+                result = process_turn(game, players, agents, current_player_id, void_player_id, config,
+                                      filter_times, K)
+        except GameOver:
             break
+        finally:
+            flush_turn_output(turn_output)
         
-        action_taken, skip_count = result
-        
-        if action_taken:
-            consecutive_skips = 0
+        if result:
+            skipped.clear()
         else:
-            consecutive_skips += skip_count
-            if consecutive_skips >= config.n_players:
-                print("All players skipped. Ending game.")
+            skipped.add(current_player_id)
+            if len(skipped) == n_players:
+                log("All players skipped. Ending game.")
                 break
+        
+        current_player_id = current_player_id + 1 if current_player_id + 1 < n_players else 0
 
 
 def print_game_results(game: Game, config: GameConfig):
-    print("\n=== Game Over ===")
+    log("\n=== Game Over ===")
     if game.has_team_won():
-        print("Team WON! All wires revealed.")
-        print(f"Wrong calls: {game.wrong_calls_count}/{config.max_wrong_calls}")
+        log("Team WON! All wires revealed.")
+        log(f"Wrong calls: {game.wrong_calls_count}/{game.max_wrong_calls}")
+    else:
+        log(f"Team LOST. Wrong calls: {game.wrong_calls_count}/{game.max_wrong_calls}")
+    log(f"Total turns: {game.current_turn}")
+
+
+def write_json(path: str, data, indent: bool = False):
+    """
+    Write data as JSON, using orjson when it is installed.
+    
+    Args:
+        path: Output file path
+        data: JSON-serializable data
+        indent: Pretty-print with 2-space indentation
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        Path(path).write_bytes(orjson.dumps(data, option=option))
     else:
-        print(f"Team LOST. Wrong calls: {game.wrong_calls_count}/{config.max_wrong_calls}")
-    print(f"Total turns: {game.current_turn}")
+        if indent:
+            text = json.dumps(data, indent=2)
+        else:
+            text = json.dumps(data, separators=(",", ":"))  # Compact, like orjson's default
+        Path(path).write_text(text, encoding="utf-8")
 
 
 def save_game_logs(game: Game, players: List[Player]):
     timestamp = time.strftime("%Y%m%d_%H%M%S")
     log_folder = f"logs/game_{timestamp}"
     
-    if not os.path.exists(log_folder):
-        os.makedirs(log_folder)
+    Path(log_folder).mkdir(parents=True, exist_ok=True)
     
-    action_history = {
-        "calls": [asdict(r) for r in game.call_history],
-        "double_reveals": [asdict(r) for r in game.double_reveal_history],
-        "swaps": [asdict(r) for r in game.swap_history],
-        "signals": [asdict(r) for r in game.signal_history],
-        "reveals": [asdict(r) for r in game.reveal_history],
-        "not_present": [asdict(r) for r in game.not_present_history],
-        "has_values": game.has_values_history,
-        "copy_count_signals": [asdict(r) for r in game.copy_count_signal_history],
-        "adjacent_signals": [asdict(r) for r in game.adjacent_signal_history]
-    }
+    # Records are serialized by Game as they happen
+    action_history = game.get_action_history()
+    
+    write_json(f"{log_folder}/action_history.json", action_history, indent=True)
     
-    with open(f"{log_folder}/action_history.json", "w") as f:
-        json.dump(action_history, f, indent=2)
+    log(f"\nSaving belief states to {log_folder}...")
+    # All players' beliefs go into a single file (one open/write instead of two per player)
+    belief_states = {
+        str(player.player_id): player.belief_system.to_dict()
+        for player in players if player.belief_system
+    }
+    write_json(f"{log_folder}/beliefs.json", belief_states)
+    log("Done.")
+
+
+def run_simulation(agent_cls: Type[BaseAgent] = SmartestAgent, K: int = 1, max_turns: int = 100,
+                   use_global_belief: bool = USE_GLOBAL_BELIEF, verbose: bool = VERBOSE):
+    """
+    Run a full automated game.
     
-    print(f"\nSaving belief states to {log_folder}...")
-    for player in players:
-        if player.belief_system:
-            player.belief_system.save_to_folder(log_folder)
-    print("Done.")
-
-
-def run_simulation():
-    config = GameConfig(playing_irl=False, auto_filter=False, use_global_belief=USE_GLOBAL_BELIEF)
-    game, players, agents, void_player_id = setup_game(config)
-    send_initial_signals(game, players, void_player_id)
-    run_game_loop(game, players, agents, void_player_id, config)
-    print_game_results(game, config)
-    save_game_logs(game, players)
+    Args:
+        agent_cls: Agent class used for every player (SmartestAgent needs the global belief model)
+        K: Filter cadence; 1 filters the current player every turn, otherwise
+           filters are applied and timed every K turns
+        max_turns: Turn limit for the game loop
+        use_global_belief: Whether players use the GlobalBeliefModel
+        verbose: If False, per-turn diagnostic printing is skipped so the
+                 game loop only runs agent decisions and game actions
+    """
+    global VERBOSE
+    # Restored afterwards so one quiet run does not silence later callers
+    previous_verbose, VERBOSE = VERBOSE, verbose
+    try:
+        config = GameConfig(playing_irl=False, auto_filter=False, use_global_belief=use_global_belief)
+        game, players, agents, void_player_id = setup_game(config, agent_cls)
+        send_initial_signals(game, players, void_player_id)
+        # Timings are only measured (and written) when filtering every K turns
+        filter_times = FilterTimeLog(filter_log_filename(config) if K != 1 else None)
+        try:
+            run_game_loop(game, players, agents, void_player_id, config, K=K, max_turns=max_turns,
+                          filter_times=filter_times)
+        finally:
+            filter_times.close()
+        print_game_results(game, config)
+        save_game_logs(game, players)
+    finally:
+        VERBOSE = previous_verbose
 
 
 if __name__ == "__main__":
@@ -7,12 +7,14 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 from config.game_config import GameConfig
 from src.game import Game
 from src.player import Player
 from src.utils import (
     run_irl_game_session,
+    apply_irl_action,
     save_action_history,
     load_action_history
 )
@@ -69,10 +71,23 @@ class BombBusterGUI:
         
         # UI state
         self.current_action_type = "call"
+        self._refresh_pending = False    # A redraw is queued for the next idle tick
+        self._rebuild_requested = False  # ...and it should replay the full history first
+        self._status_after = None        # Pending after() that clears a transient status message
+        self._state_text = ""            # Last game state line, restored after a status message
+        
+        # Full-history rebuilds run off the Tk thread (one at a time)
+        self._worker = ThreadPoolExecutor(max_workers=1)
+        self._rebuild_future = None
         
         # Create config
         self.config = GameConfig(playing_irl=True, use_global_belief=self.use_global_belief, auto_filter=False)
         
+        # Card display orders (other players' hands are shown reversed) and position labels
+        self._own_positions = tuple(range(self.config.wires_per_player))
+        self._other_positions = self._own_positions[::-1]
+        self._pos_labels = tuple(f"Pos {pos+1}" for pos in self._own_positions)
+        
         # Load existing actions if available
         if self.load_existing:
             old_history = load_action_history(self.belief_folder, self.my_player_id)
@@ -93,26 +108,34 @@ class BombBusterGUI:
         # Setup UI
         self.setup_main_ui()
     
-    def initialize_game(self):
-        """Initialize the game with current settings."""
-        result = run_irl_game_session(
+    def session_kwargs(self) -> Dict:
+        """Arguments for run_irl_game_session, with copies of the action lists.
+        
+        The copies keep a background rebuild unaffected by actions added
+        while it runs.
+        """
+        return dict(
             my_wire=self.my_wire,
             my_player_id=self.my_player_id,
-            calls=self.calls,
+            calls=list(self.calls),
             config=self.config,
             belief_folder=self.belief_folder,
             player_names=self.player_names,
-            double_reveals=self.double_reveals,
-            swaps=self.swaps,
-            signals=self.signals,
-            reveals=self.reveals,
-            not_present=self.not_present,
-            has_values=self.has_values,
-            copy_count_signals=self.copy_count_signals,
-            adjacent_signals=self.adjacent_signals,
+            double_reveals=list(self.double_reveals),
+            swaps=list(self.swaps),
+            signals=list(self.signals),
+            reveals=list(self.reveals),
+            not_present=list(self.not_present),
+            has_values=list(self.has_values),
+            copy_count_signals=list(self.copy_count_signals),
+            adjacent_signals=list(self.adjacent_signals),
             save_to_json=self.auto_save,
             load_from_json=self.load_existing
         )
+    
+    def initialize_game(self):
+        """Initialize the game with current settings."""
+        result = run_irl_game_session(**self.session_kwargs())
         
         self.game = result['game']
         self.my_player = result['my_player']
@@ -185,7 +208,7 @@ class BombBusterGUI:
         button_frame = tk.Frame(title_frame, bg="#1565C0")
         button_frame.pack(side=tk.RIGHT, padx=10)
         
-        tk.Button(button_frame, text="SAVE & REFRESH", command=self.save_and_refresh,
+        tk.Button(button_frame, text="SAVE & REFRESH", command=lambda: self.schedule_refresh(rebuild=True),
                  bg="#FFC107", fg="black", padx=15, pady=5, font=("Arial", 10, "bold")).pack(side=tk.LEFT, padx=5)
     
     def setup_action_selector(self):
@@ -213,49 +236,41 @@ class BombBusterGUI:
         for label, action_type in actions:
             btn = tk.Button(selector_frame, text=label, 
                           command=lambda at=action_type: self.switch_action_panel(at),
-                          padx=15, pady=8, font=("Arial", 9, "bold"))
+                          bg="white", fg="black", padx=15, pady=8, font=("Arial", 9, "bold"))
             btn.pack(side=tk.LEFT, padx=5)
             self.action_buttons[action_type] = btn
     
     def setup_action_panels(self):
-        """Create all action panels."""
-        self.call_panel = CallActionPanel(self.action_container, self)
-        self.swap_panel = SwapActionPanel(self.action_container, self)
-        self.double_reveal_panel = DoubleRevealActionPanel(self.action_container, self)
-        self.signal_panel = SignalActionPanel(self.action_container, self)
-        self.advanced_signals_panel = AdvancedSignalsPanel(self.action_container, self)
-        self.not_present_panel = NotPresentActionPanel(self.action_container, self)
-        self.has_value_panel = HasValueActionPanel(self.action_container, self)
-        self.suggester_panel = SuggesterPanel(self.action_container, self)
-        self.entropy_panel = EntropyPanel(self.action_container, self)
-        
-        self.panels = {
-            "call": self.call_panel,
-            "swap": self.swap_panel,
-            "double_reveal": self.double_reveal_panel,
-            "signal": self.signal_panel,
-            "advanced_signals": self.advanced_signals_panel,
-            "not_present": self.not_present_panel,
-            "has_value": self.has_value_panel,
-            "suggestions": self.suggester_panel,
-            "entropy": self.entropy_panel
+        """Register the action panels; each is built the first time it is shown."""
+        self.panel_classes = {
+            "call": CallActionPanel,
+            "swap": SwapActionPanel,
+            "double_reveal": DoubleRevealActionPanel,
+            "signal": SignalActionPanel,
+            "advanced_signals": AdvancedSignalsPanel,
+            "not_present": NotPresentActionPanel,
+            "has_value": HasValueActionPanel,
+            "suggestions": SuggesterPanel,
+            "entropy": EntropyPanel
         }
+        self.panels = {}
     
     def switch_action_panel(self, action_type):
         """Switch to the specified action panel."""
-        # Hide all panels
-        for panel in self.panels.values():
-            panel.pack_forget()
+        # Hide the panel currently shown (the others are already unpacked)
+        current_panel = self.panels.get(self.current_action_type)
+        if current_panel is not None:
+            current_panel.pack_forget()
         
-        # Show selected panel
-        self.panels[action_type].pack(fill=tk.BOTH, expand=True)
+        # Show selected panel (built on first use)
+        panel = self.panels.get(action_type)
+        if panel is None:
+            panel = self.panels[action_type] = self.panel_classes[action_type](self.action_container, self)
+        panel.pack(fill=tk.BOTH, expand=True)
         
-        # Update button styles
-        for at, btn in self.action_buttons.items():
-            if at == action_type:
-                btn.config(bg="#4A90E2", fg="white", relief=tk.SUNKEN)
-            else:
-                btn.config(bg="white", fg="black", relief=tk.RAISED)
+        # Update button styles (only the previously active and the new button change)
+        self.action_buttons[self.current_action_type].config(bg="white", fg="black", relief=tk.RAISED)
+        self.action_buttons[action_type].config(bg="#4A90E2", fg="white", relief=tk.SUNKEN)
         
         self.current_action_type = action_type
     
@@ -275,11 +290,11 @@ class BombBusterGUI:
             invalid_value: Optional value to check - positions that cannot have this value will be greyed out
             entropy_best_position_values: Optional dict {position -> set of values} for entropy-suggested calls
         """
-        # Clear the frame
-        for widget in parent_frame.winfo_children():
-            widget.destroy()
-        
         if not self.my_player or not self.my_player.belief_system:
+            # Clear the frame
+            for widget in parent_frame.winfo_children():
+                widget.destroy()
+            parent_frame._hand_cache = None
             return
         
         player_name = self.player_names.get(player_id, f"Player {player_id}")
@@ -288,25 +303,21 @@ class BombBusterGUI:
         if title is None:
             title = f"{player_name}'s Hand"
         
-        if title:
-            title_label = tk.Label(parent_frame, text=title, font=("Arial", 10, "bold"))
-            title_label.pack(anchor=tk.W, pady=(0, 5))
-        
-        # Wire cards frame
-        cards_frame = tk.Frame(parent_frame)
-        cards_frame.pack()
+        # Reuse the card widgets from the previous draw into this frame when the
+        # layout is unchanged; only their contents and colors are updated below
+        layout_key = (player_id, title, self.config.wires_per_player, id(panel), player_key)
+        cache = getattr(parent_frame, "_hand_cache", None)
+        if cache is None or cache["key"] != layout_key or not cache["cards_frame"].winfo_exists():
+            cache = self._build_hand_widgets(parent_frame, player_id, title, panel, player_key)
+            cache["key"] = layout_key
+            parent_frame._hand_cache = cache
         
         # Get beliefs for this player
         beliefs = self.my_player.belief_system.beliefs[player_id]
         value_trackers = self.my_player.belief_system.value_trackers
         
-        # Determine if we need to reverse (if viewing another player, show reversed)
-        positions = range(self.config.wires_per_player)
-        if player_id != self.my_player_id:
-            positions = reversed(positions)
-            positions = list(positions)  # Convert to list for indexing
-        
-        for display_col, pos in enumerate(positions):
+        for card in cache["cards"]:
+            pos = card["pos"]
             pos_beliefs = beliefs[pos]
             
             # Check if this position can have the invalid_value (for greying out)
@@ -365,7 +376,7 @@ class BombBusterGUI:
                     border_color = "#9B30FF"  # Purple border for certain/entropy-suggested calls
                     border_width = 4
             
-            # Create card frame
+            # Card frame
             # Use fixed size to ensure all cards are same size regardless of content
             # Reduce size for invalid positions
             frame_width = 70 if is_invalid_position else 100
@@ -375,132 +386,200 @@ class BombBusterGUI:
             if playable_values is not None and not is_invalid_position:
                 frame_width = 100
                 frame_height = 120
-                
-            card_frame = tk.Frame(cards_frame, relief=tk.RIDGE, borderwidth=border_width,
-                                 highlightbackground=border_color, highlightthickness=border_width,
-                                 bg=border_color, width=frame_width, height=frame_height)
-            card_frame.pack_propagate(False)
-            card_frame.grid(row=0, column=display_col, padx=2)
             
             # Position label below
             pos_font_size = 7 if is_invalid_position else 8
-            pos_label = tk.Label(card_frame, text=f"Pos {pos+1}", 
-                               font=("Arial", pos_font_size), bg="#f0f0f0")
-            pos_label.pack(side=tk.BOTTOM, fill=tk.X)
+            
+            # Only touch the widgets of cards whose look changed since the last draw
+            frame_state = (border_width, border_color, frame_width, frame_height, pos_font_size)
+            if card["frame_state"] != frame_state:
+                card["frame"].config(borderwidth=border_width,
+                                     highlightbackground=border_color, highlightthickness=border_width,
+                                     bg=border_color, width=frame_width, height=frame_height)
+                card["pos_label"].config(font=("Arial", pos_font_size))
+                card["frame_state"] = frame_state
             
             # Determine content
             if len(pos_beliefs) == 1:
                 # Single value - either revealed or certain
-                value = list(pos_beliefs)[0]
+                value = next(iter(pos_beliefs))
                 display_value = str(value)
                 
-                # Check if it's revealed
-                is_revealed = False
-                for rev_pid, rev_pos in value_trackers[value].revealed:
-                    if rev_pid == player_id and rev_pos == pos:
-                        is_revealed = True
-                        bg_color = "#7ED321" if not is_invalid_position else "#A9D3A0"  # Lighter green for invalid
-                        break
-                
-                if not is_revealed:
+                # Check if it's revealed (set lookup kept by the value tracker)
+                if value_trackers[value].is_revealed(player_id, pos):
+                    bg_color = "#7ED321" if not is_invalid_position else "#A9D3A0"  # Lighter green for invalid
+                else:
                     # It's certain (deduced)
                     bg_color = "#F8E71C" if not is_invalid_position else "#D8CA7A"  # Lighter yellow for invalid
                 
                 value_font_size = 10 if is_invalid_position else 12
                 value_font = ("Arial", value_font_size, "bold")
-                value_label = tk.Label(card_frame, text=display_value, width=4, height=3,
-                                      bg=bg_color, font=value_font)
-                value_label.pack(expand=True, fill=tk.BOTH)
+                self._set_card_label(card, display_value, bg_color, value_font)
                 
             elif playable_values is not None:
                 # Suggestion mode: Show all values, colored
-                # Use a grid of labels for better layout control
-                
-                # Create a container frame for the grid
-                grid_frame = tk.Frame(card_frame, bg=bg_color)
-                grid_frame.pack(expand=True, fill=tk.BOTH, padx=2, pady=2)
-                
-                sorted_vals = sorted(list(pos_beliefs))
-                num_vals = len(sorted_vals)
-                
-                # Determine grid dimensions
-                # If few values, 1 column. If many, 2 or 3 columns.
-                if num_vals <= 4:
-                    columns = 1
-                elif num_vals <= 8:
-                    columns = 2
-                else:
-                    columns = 3
-                    
-                for i, val in enumerate(sorted_vals):
-                    row = i // columns
-                    col = i % columns
-                    
-                    # Color playable values in red
-                    fg_color = "red" if val in playable_values else "black"
-                    font_weight = "bold" if val in playable_values else "normal"
-                    
-                    # Adjust font size based on count
-                    font_size = 14
-                    if num_vals > 8:
-                        font_size = 10
-                    elif num_vals > 4:
-                        font_size = 12
-                        
-                    lbl = tk.Label(grid_frame, text=str(val), 
-                                  fg=fg_color, bg=bg_color,
-                                  font=("Arial", font_size, font_weight))
-                    
-                    # Center in its cell
-                    lbl.grid(row=row, column=col, sticky="nsew", padx=1, pady=1)
-                    
-                # Configure grid weights to distribute space
-                for c in range(columns):
-                    grid_frame.columnconfigure(c, weight=1)
-                for r in range((num_vals + columns - 1) // columns):
-                    grid_frame.rowconfigure(r, weight=1)
-                
-                # Bind click events to the grid frame and all labels
-                if panel and player_key is not None:
-                    handler = lambda e, p=pos: self._on_hand_click(panel, player_key, p)
-                    grid_frame.bind("<Button-1>", handler)
-                    for child in grid_frame.winfo_children():
-                        child.bind("<Button-1>", handler)
+                sorted_vals = sorted(pos_beliefs)
+                grid_state = (tuple(sorted_vals), tuple(val in playable_values for val in sorted_vals), bg_color)
+                if card["kind"] != "grid" or card["content_state"] != grid_state:
+                    self._build_card_grid(card, sorted_vals, playable_values, bg_color)
+                    card["content_state"] = grid_state
 
             elif len(pos_beliefs) < 5:
                 # Uncertain but few possibilities
                 display_value = "\n".join(str(v) for v in sorted(pos_beliefs))
                 uncertain_font_size = 8 if is_invalid_position else 10
                 uncertain_font = ("Arial", uncertain_font_size)
-                value_label = tk.Label(card_frame, text=display_value, width=4, height=3,
-                                      bg=bg_color, font=uncertain_font)
-                value_label.pack(expand=True, fill=tk.BOTH)
+                self._set_card_label(card, display_value, bg_color, uncertain_font)
             else:
                 # Many possibilities
                 display_value = f"#{len(pos_beliefs)}"
                 many_font_size = 10 if is_invalid_position else 12
                 many_font = ("Arial", many_font_size, "bold")
-                value_label = tk.Label(card_frame, text=display_value, width=4, height=3,
-                                      bg=bg_color, font=many_font)
-                value_label.pack(expand=True, fill=tk.BOTH)
-
+                self._set_card_label(card, display_value, bg_color, many_font)
+    
+    def _build_hand_widgets(self, parent_frame, player_id, title, panel, player_key) -> Dict:
+        """Create the title, empty card frames and legend for draw_player_hand.
+        
+        Args:
+            parent_frame: The frame to draw in (cleared first)
+            player_id: The player whose hand is displayed
+            title: Title text (empty for none)
+            panel: The panel receiving card clicks, if any
+            player_key: The key identifying the player in the panel
+            
+        Returns:
+            Dict with the cards frame and one entry per card, in display order
+        """
+        # Clear the frame
+        for widget in parent_frame.winfo_children():
+            widget.destroy()
+        
+        if title:
+            title_label = tk.Label(parent_frame, text=title, font=("Arial", 10, "bold"))
+            title_label.pack(anchor=tk.W, pady=(0, 5))
+        
+        # Wire cards frame
+        cards_frame = tk.Frame(parent_frame)
+        cards_frame.pack()
+        
+        # Determine if we need to reverse (if viewing another player, show reversed)
+        positions = self._own_positions if player_id == self.my_player_id else self._other_positions
+        
+        cards = []
+        for display_col, pos in enumerate(positions):
+            card_frame = tk.Frame(cards_frame, relief=tk.RIDGE)
+            card_frame.pack_propagate(False)
+            card_frame.grid(row=0, column=display_col, padx=2)
+            
+            pos_label = tk.Label(card_frame, text=self._pos_labels[pos], bg="#f0f0f0")
+            pos_label.pack(side=tk.BOTTOM, fill=tk.X)
+            
             # Bind click events if panel is provided
+            handler = None
             if panel and player_key is not None:
-                # Use partial or lambda with default arg to capture pos
+                # Use lambda with default arg to capture pos
                 handler = lambda e, p=pos: self._on_hand_click(panel, player_key, p)
                 card_frame.bind("<Button-1>", handler)
-                if 'value_label' in locals():
-                    value_label.bind("<Button-1>", handler)
                 pos_label.bind("<Button-1>", handler)
-                
                 # Change cursor to hand
-                value_label.config(cursor="hand2")
                 pos_label.config(cursor="hand2")
+            
+            cards.append({"pos": pos, "frame": card_frame, "pos_label": pos_label,
+                          "content": None, "kind": None, "handler": handler,
+                          "frame_state": None, "content_state": None})
         
         # Legend (compact version)
         legend_frame = tk.Frame(parent_frame)
         legend_frame.pack(pady=5)
         
+        return {"cards_frame": cards_frame, "cards": cards}
+    
+    def _build_card_grid(self, card: Dict, sorted_vals: List, playable_values: set, bg_color: str):
+        """Fill a card with a grid of its candidate values (suggestion mode).
+        
+        Args:
+            card: Card entry from _build_hand_widgets
+            sorted_vals: The position's candidate values, sorted
+            playable_values: Values to highlight as playable
+            bg_color: Background color
+        """
+        # Use a grid of labels for better layout control
+        if card["content"] is not None:
+            card["content"].destroy()
+        
+        # Create a container frame for the grid
+        grid_frame = tk.Frame(card["frame"], bg=bg_color)
+        grid_frame.pack(expand=True, fill=tk.BOTH, padx=2, pady=2)
+        card["content"], card["kind"] = grid_frame, "grid"
+        
+        num_vals = len(sorted_vals)
+        
+        # Determine grid dimensions
+        # If few values, 1 column. If many, 2 or 3 columns.
+        if num_vals <= 4:
+            columns = 1
+        elif num_vals <= 8:
+            columns = 2
+        else:
+            columns = 3
+            
+        for i, val in enumerate(sorted_vals):
+            row = i // columns
+            col = i % columns
+            
+            # Color playable values in red
+            fg_color = "red" if val in playable_values else "black"
+            font_weight = "bold" if val in playable_values else "normal"
+            
+            # Adjust font size based on count
+            font_size = 14
+            if num_vals > 8:
+                font_size = 10
+            elif num_vals > 4:
+                font_size = 12
+                
+            lbl = tk.Label(grid_frame, text=str(val), 
+                          fg=fg_color, bg=bg_color,
+                          font=("Arial", font_size, font_weight))
+            
+            # Center in its cell
+            lbl.grid(row=row, column=col, sticky="nsew", padx=1, pady=1)
+            
+        # Configure grid weights to distribute space
+        for c in range(columns):
+            grid_frame.columnconfigure(c, weight=1)
+        for r in range((num_vals + columns - 1) // columns):
+            grid_frame.rowconfigure(r, weight=1)
+        
+        # Bind click events to the grid frame and all labels
+        if card["handler"] is not None:
+            grid_frame.bind("<Button-1>", card["handler"])
+            for child in grid_frame.winfo_children():
+                child.bind("<Button-1>", card["handler"])
+    
+    def _set_card_label(self, card: Dict, text: str, bg_color: str, font: Tuple):
+        """Show a single value label in a card, reusing the existing label if there is one.
+        
+        Args:
+            card: Card entry from _build_hand_widgets
+            text: Label text
+            bg_color: Label background color
+            font: Label font
+        """
+        if card["kind"] != "label":
+            if card["content"] is not None:
+                card["content"].destroy()
+            value_label = tk.Label(card["frame"], width=4, height=3)
+            value_label.pack(expand=True, fill=tk.BOTH)
+            if card["handler"] is not None:
+                value_label.bind("<Button-1>", card["handler"])
+                value_label.config(cursor="hand2")
+            card["content"], card["kind"] = value_label, "label"
+        elif card["content_state"] == (text, bg_color, font):
+            return
+        card["content"].config(text=text, bg=bg_color, font=font)
+        card["content_state"] = (text, bg_color, font)
+    
     def _on_hand_click(self, panel, player_key, position):
         """Handle click on a hand card."""
         if hasattr(panel, 'handle_hand_click'):
@@ -530,67 +609,190 @@ class BombBusterGUI:
                    f"Total Actions: {state['total_calls']}  |  "
                    f"Wrong Calls: {state['wrong_calls_count']}/{self.config.max_wrong_calls}  |  "
                    f"Status: {status}")
-            self.state_label.config(text=text)
+            self._state_text = text
+            if self._status_after is None:
+                self.state_label.config(text=text)
     
-    def add_action(self, action_type, action_data):
-        """Add an action and refresh the game."""
+    def show_status(self, message: str, duration_ms: int = 1500):
+        """Show a transient message in the state bar, then restore the game state.
+        
+        Non-blocking replacement for an info dialog, which would run a nested
+        event loop in the middle of an action.
+        
+        Args:
+            message: Text to show
+            duration_ms: How long to show it
+        """
+        if self._status_after is not None:
+            self.root.after_cancel(self._status_after)
+        self.state_label.config(text=message)
+        self._status_after = self.root.after(duration_ms, self._clear_status)
+    
+    def _clear_status(self):
+        """Put the game state line back after show_status."""
+        self._status_after = None
+        self.state_label.config(text=self._state_text)
+    
+    def add_action(self, action_type, action_data) -> bool:
+        """Add an action and apply it to the current game.
+        
+        Returns:
+            True if the action was accepted; errors are reported in a dialog
+        """
         try:
             if action_type == "call":
-                self.calls.append(action_data)
+                history = self.calls
             elif action_type == "swap":
-                self.swaps.append(action_data)
+                history = self.swaps
             elif action_type == "double_reveal":
-                self.double_reveals.append(action_data)
+                history = self.double_reveals
             elif action_type == "signal":
-                self.signals.append(action_data)
+                history = self.signals
             elif action_type == "reveal":
-                self.reveals.append(action_data)
+                history = self.reveals
             elif action_type == "not_present":
-                self.not_present.append(action_data)
+                history = self.not_present
             elif action_type == "has_value":
-                self.has_values.append(action_data)
+                history = self.has_values
             elif action_type == "copy_count_signal":
-                self.copy_count_signals.append(action_data)
+                history = self.copy_count_signals
             elif action_type == "adjacent_signal":
-                self.adjacent_signals.append(action_data)
+                history = self.adjacent_signals
+            else:
+                raise ValueError(f"Unknown action type: {action_type}")
             
-            # Refresh game
-            self.save_and_refresh()
+            history.append(action_data)
+            try:
+                self.apply_new_action(action_type, action_data)
+            except ValueError:
+                # The action was rejected by the game, so don't keep it in the history
+                history.pop()
+                raise
             
-            messagebox.showinfo("Success", "Action added successfully!")
+            self.show_status("✅ Action added successfully!")
+            return True
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to add action:\n{str(e)}")
+            return False
+    
+    def apply_new_action(self, action_type, action_data):
+        """Apply a single new action on top of the current game and save.
+        
+        Only the new action goes through the belief system; the full history
+        is replayed only by save_and_refresh (e.g. after manual corrections).
+        
+        Args:
+            action_type: The action kind (see apply_irl_action)
+            action_data: The action tuple, already appended to its history list
+        """
+        if self.game is None or self._rebuild_future is not None:
+            # A rebuild in flight would replace self.game; replay everything after it
+            self.schedule_refresh(rebuild=True)
+            return
+        
+        apply_irl_action(self.game, action_type, action_data, self.player_names, self.my_player_id)
+        
+        if self.auto_save and self.my_player.belief_system is not None:
+            self.my_player.belief_system.save_to_folder(self.belief_folder, self.player_names)
+            save_action_history(self.belief_folder, self.my_player_id,
+                                self.calls, self.double_reveals, self.swaps, self.signals, self.reveals,
+                                self.not_present, self.has_values, self.copy_count_signals,
+                                self.adjacent_signals)
+        
+        self.schedule_refresh()
     
     def save_and_refresh(self):
-        """Save current state and refresh the game."""
+        """Save current state and refresh the game.
+        
+        The full session replay runs on the worker thread; the result is
+        picked up on the Tk thread by _poll_rebuild.
+        """
+        if self._rebuild_future is not None:
+            # Run again once the current one lands, so it sees the latest actions
+            self._rebuild_requested = True
+            return
+        
+        self.root.config(cursor="watch")
+        self._rebuild_future = self._worker.submit(run_irl_game_session, **self.session_kwargs())
+        self.root.after(50, self._poll_rebuild)
+    
+    def rebuild_in_progress(self) -> bool:
+        """Whether a full session replay is running on the worker thread.
+        
+        The replay loads and saves the belief folder, so Tk-side paths that
+        filter (and auto-save) beliefs must wait for it; _poll_rebuild redraws
+        the views once it lands.
+        """
+        return self._rebuild_future is not None
+    
+    def _poll_rebuild(self):
+        """Install the result of the background rebuild once it is done."""
+        future = self._rebuild_future
+        if not future.done():
+            self.root.after(50, self._poll_rebuild)
+            return
+        
+        self._rebuild_future = None
+        self.root.config(cursor="")
         try:
-            # Re-initialize game with all actions
-            self.initialize_game()
-            
-            # Refresh displays
-            self.update_game_state()
-            
-            # Refresh hand viewers in the current action panel
-            current_panel = self.panels.get(self.current_action_type)
-            if current_panel:
-                if hasattr(current_panel, 'refresh'):
-                    current_panel.refresh()
-                elif hasattr(current_panel, 'hand_viewer_frame'):
-                    # Refresh all hand frames in the panel
-                    for player_key in ['caller', 'target', 'player', 'player1', 'player2']:
-                        if player_key in current_panel.selections and hasattr(current_panel, f'{player_key}_hand_frame'):
-                            frame = getattr(current_panel, f'{player_key}_hand_frame')
-                            player_id = current_panel.selections[player_key]
-                            position_key = current_panel.get_position_key_for_player(player_key)
-                            self.draw_player_hand(frame, player_id, position_key=position_key, panel=current_panel, player_key=player_key)
-            
+            result = future.result()
+            self.game = result['game']
+            self.my_player = result['my_player']
+            self.refresh_views()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to refresh:\n{str(e)}")
+        
+        if self._rebuild_requested:
+            self.schedule_refresh()
+    
+    def schedule_refresh(self, rebuild: bool = False):
+        """Queue a redraw for the next idle tick.
+        
+        Requests made before it runs (e.g. a burst of clicks) collapse into a
+        single refresh; it replays the full history if any of them asked to.
+        
+        Args:
+            rebuild: Re-run the full game session (save_and_refresh) before redrawing
+        """
+        self._rebuild_requested = self._rebuild_requested or rebuild
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.root.after_idle(self._do_refresh)
+    
+    def _do_refresh(self):
+        """Run the refresh queued by schedule_refresh."""
+        self._refresh_pending = False
+        if self._rebuild_requested:
+            self._rebuild_requested = False
+            self.save_and_refresh()
+        else:
+            self.refresh_views()
+    
+    def refresh_views(self):
+        """Redraw the game state and the hand viewers of the current panel."""
+        self.update_game_state()
+        
+        # Refresh hand viewers in the current action panel
+        current_panel = self.panels.get(self.current_action_type)
+        if current_panel:
+            if hasattr(current_panel, 'refresh'):
+                current_panel.refresh()
+            elif hasattr(current_panel, 'hand_viewer_frame'):
+                # Refresh all hand frames in the panel
+                for player_key, frame in current_panel.hand_frames.items():
+                    if player_key in current_panel.selections:
+                        player_id = current_panel.selections[player_key]
+                        position_key = current_panel.get_position_key_for_player(player_key)
+                        self.draw_player_hand(frame, player_id, position_key=position_key, panel=current_panel, player_key=player_key)
     
     def run(self):
         """Run the GUI application."""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._worker.shutdown(wait=False, cancel_futures=True)
 
 
 class ActionPanel(tk.Frame):
@@ -601,6 +803,67 @@ class ActionPanel(tk.Frame):
         self.app = app
         self.selections = {}
         self.vars = {}  # Store Tk variables
+        self.hand_frames: Dict[str, tk.Frame] = {}  # player key -> hand viewer frame
+    
+    def queue_action(self, action_type, *actions):
+        """Hand actions to the app once Tk is idle.
+        
+        The click handler returns right away; the belief update runs on the
+        next idle pass. Queued actions run in order and stop at the first one
+        that is rejected; the panel is cleared only if every action was
+        accepted, so the rejected one can be corrected.
+        
+        Args:
+            action_type: The action kind (see BombBusterGUI.add_action)
+            *actions: The action tuples
+        """
+        self.after_idle(self._add_queued_actions, action_type, actions)
+    
+    def _add_queued_actions(self, action_type, actions):
+        """Run the actions queued by queue_action and clear the panel on success."""
+        for i, action in enumerate(actions):
+            if not self.app.add_action(action_type, action):
+                self.deselect_accepted(actions[:i])
+                return
+        self.clear()
+    
+    def deselect_accepted(self, actions):
+        """Drop the selections behind actions accepted before a later one was rejected.
+        
+        Only panels that submit several actions at once need to override this,
+        so resubmitting does not add the accepted ones twice.
+        
+        Args:
+            actions: The accepted action tuples
+        """
+    
+    def warn(self, message):
+        """Show a validation message in the app's state bar instead of a dialog."""
+        self.app.show_status(f"⚠️ {message}", 3000)
+    
+    def create_title(self, text):
+        """Create the bold panel heading."""
+        tk.Label(self, text=text, font=("Arial", 14, "bold"), fg="#333333").pack(pady=10)
+    
+    def create_hand_frame(self, player_key):
+        """Create and register the hand viewer frame for a player key."""
+        frame = tk.Frame(self)
+        frame.pack(fill=tk.X, pady=5, padx=10)
+        self.hand_frames[player_key] = frame
+        return frame
+    
+    def create_hint(self, text):
+        """Create the italic usage hint shown under the inputs."""
+        tk.Label(self, text=text, font=("Arial", 9, "italic"), fg="#666666").pack(pady=5)
+    
+    def create_action_buttons(self, text, command):
+        """Create the submit and CLEAR buttons at the bottom of the panel."""
+        button_frame = tk.Frame(self)
+        button_frame.pack(pady=20)
+        tk.Button(button_frame, text=text, command=command,
+                 bg="#4CAF50", fg="white", padx=30, pady=10, font=("Arial", 11, "bold")).pack(side=tk.LEFT, padx=10)
+        tk.Button(button_frame, text="CLEAR", command=self.clear,
+                 bg="#F44336", fg="white", padx=20, pady=10, font=("Arial", 11, "bold")).pack(side=tk.LEFT, padx=10)
     
     def create_player_buttons(self, parent, label, key):
         """Create player selection buttons."""
@@ -614,12 +877,17 @@ class ActionPanel(tk.Frame):
         
         self.vars[key] = tk.IntVar(value=-1)
         
+        # One handler for the whole row: the radiobutton sets the variable to
+        # its player ID before running the command
+        var = self.vars[key]
+        on_select = lambda: self.select_player(key, var.get())
+        
         for pid, name in self.app.player_names.items():
             btn = tk.Radiobutton(button_frame, text=name, width=10,
-                               variable=self.vars[key], value=pid,
+                               variable=var, value=pid,
                                indicatoron=0, bg="white", selectcolor="#4A90E2",
                                font=("Arial", 9),
-                               command=lambda k=key, p=pid: self.select_player(k, p))
+                               command=on_select)
             btn.pack(side=tk.LEFT, padx=2)
     
     
@@ -660,8 +928,8 @@ class ActionPanel(tk.Frame):
         self.selections[key] = player_id
         
         # Update hand display if this panel has a hand viewer frame
-        if hasattr(self, 'hand_viewer_frame') and hasattr(self, f'{key}_hand_frame'):
-            frame = getattr(self, f'{key}_hand_frame')
+        if hasattr(self, 'hand_viewer_frame') and key in self.hand_frames:
+            frame = self.hand_frames[key]
             # Determine the position key for highlighting selected positions
             position_key = self.get_position_key_for_player(key)
             
@@ -693,9 +961,8 @@ class ActionPanel(tk.Frame):
         # Redraw hand viewer to show selection if applicable
         if hasattr(self, 'hand_viewer_frame'):
             # Redraw all visible hand frames to ensure highlights are correct
-            for player_key in ['caller', 'target', 'player', 'player1', 'player2']:
-                if player_key in self.selections and hasattr(self, f'{player_key}_hand_frame'):
-                    frame = getattr(self, f'{player_key}_hand_frame')
+            for player_key, frame in self.hand_frames.items():
+                if player_key in self.selections:
                     position_key = self.get_position_key_for_player(player_key)
                     
                     # For CallActionPanel, pass the selected value to grey out invalid positions
@@ -729,11 +996,9 @@ class ActionPanel(tk.Frame):
             var.set(-1)
         
         # Clear hand viewer frames
-        for player_key in ['caller', 'target', 'player', 'player1', 'player2']:
-            if hasattr(self, f'{player_key}_hand_frame'):
-                frame = getattr(self, f'{player_key}_hand_frame')
-                for widget in frame.winfo_children():
-                    widget.destroy()
+        for frame in self.hand_frames.values():
+            for widget in frame.winfo_children():
+                widget.destroy()
 
 
 class CallActionPanel(ActionPanel):
@@ -743,7 +1008,7 @@ class CallActionPanel(ActionPanel):
         super().__init__(parent, app)
         self.hand_viewer_frame = True  # Flag to enable hand viewing
         
-        tk.Label(self, text="CALL ACTION", font=("Arial", 14, "bold"), fg="#333333").pack(pady=10)
+        self.create_title("CALL ACTION")
         
         # Value selection - MOVED TO TOP
         self.create_value_buttons(self, "Value:", "value")
@@ -751,8 +1016,7 @@ class CallActionPanel(ActionPanel):
         self.create_player_buttons(self, "Caller:", "caller")
         
         # Hand viewer for caller
-        self.caller_hand_frame = tk.Frame(self)
-        self.caller_hand_frame.pack(fill=tk.X, pady=5, padx=10)
+        self.caller_hand_frame = self.create_hand_frame("caller")
         
         # Initialize caller position variable
         self.init_position_var("caller_position")
@@ -760,8 +1024,7 @@ class CallActionPanel(ActionPanel):
         self.create_player_buttons(self, "Target:", "target")
         
         # Hand viewer for target (visual reference only)
-        self.target_hand_frame = tk.Frame(self)
-        self.target_hand_frame.pack(fill=tk.X, pady=5, padx=10)
+        self.target_hand_frame = self.create_hand_frame("target")
         
         # Position selection buttons
         self.init_position_var("position")
@@ -780,21 +1043,16 @@ class CallActionPanel(ActionPanel):
                       bg="#E8F5E9", font=("Arial", 10)).pack(side=tk.LEFT, padx=10)
         
         # Buttons
-        button_frame = tk.Frame(self)
-        button_frame.pack(pady=20)
-        tk.Button(button_frame, text="ADD CALL", command=self.add_call,
-                 bg="#4CAF50", fg="white", padx=30, pady=10, font=("Arial", 11, "bold")).pack(side=tk.LEFT, padx=10)
-        tk.Button(button_frame, text="CLEAR", command=self.clear,
-                 bg="#F44336", fg="white", padx=20, pady=10, font=("Arial", 11, "bold")).pack(side=tk.LEFT, padx=10)
+        self.create_action_buttons("ADD CALL", self.add_call)
     
     def add_call(self):
         """Add the call action."""
         if "caller" not in self.selections or "target" not in self.selections:
-            messagebox.showwarning("Incomplete", "Please select both caller and target")
+            self.warn("Please select both caller and target")
             return
         
         if "position" not in self.selections or "value" not in self.selections:
-            messagebox.showwarning("Incomplete", "Please select position and value")
+            self.warn("Please select position and value")
             return
         
         caller_name = self.app.player_names[self.selections["caller"]]
@@ -810,8 +1068,7 @@ class CallActionPanel(ActionPanel):
         else:
             action = (caller_name, target_name, position, value, success)
         
-        self.app.add_action("call", action)
-        self.clear()
+        self.queue_action("call", action)
     
     def clear(self):
         """Clear all selections."""
@@ -826,14 +1083,13 @@ class SwapActionPanel(ActionPanel):
         super().__init__(parent, app)
         self.hand_viewer_frame = True  # Flag to enable hand viewing
         
-        tk.Label(self, text="SWAP ACTION", font=("Arial", 14, "bold"), fg="#333333").pack(pady=10)
+        self.create_title("SWAP ACTION")
         
         # --- Player 1 Section ---
         self.create_player_buttons(self, "Player 1:", "player1")
         
         # Hand viewer for player 1
-        self.player1_hand_frame = tk.Frame(self)
-        self.player1_hand_frame.pack(fill=tk.X, pady=5, padx=10)
+        self.player1_hand_frame = self.create_hand_frame("player1")
         
         # Position selection variables
         self.init_position_var("init_pos1")
@@ -843,8 +1099,7 @@ class SwapActionPanel(ActionPanel):
         self.create_player_buttons(self, "Player 2:", "player2")
         
         # Hand viewer for player 2
-        self.player2_hand_frame = tk.Frame(self)
-        self.player2_hand_frame.pack(fill=tk.X, pady=5, padx=10)
+        self.player2_hand_frame = self.create_hand_frame("player2")
         
         # Position selection variables
         self.init_position_var("init_pos2")
@@ -868,16 +1123,10 @@ class SwapActionPanel(ActionPanel):
                 bg="#FFF8DC", font=("Arial", 10, "bold")).pack()
         self.create_value_buttons(self.received_value_frame, "", "received_value")
         
-        tk.Label(self, text="ℹ️ Only select received value if you are Player 1 or Player 2",
-                font=("Arial", 9, "italic"), fg="#666666").pack(pady=5)
+        self.create_hint("ℹ️ Only select received value if you are Player 1 or Player 2")
         
         # Buttons
-        button_frame = tk.Frame(self)
-        button_frame.pack(pady=20)
-        tk.Button(button_frame, text="ADD SWAP", command=self.add_swap,
-                 bg="#4CAF50", fg="white", padx=30, pady=10, font=("Arial", 11, "bold")).pack(side=tk.LEFT, padx=10)
-        tk.Button(button_frame, text="CLEAR", command=self.clear,
-                 bg="#F44336", fg="white", padx=20, pady=10, font=("Arial", 11, "bold")).pack(side=tk.LEFT, padx=10)
+        self.create_action_buttons("ADD SWAP", self.add_swap)
     
     def get_position_key_for_player(self, player_key):
         """Override to return correct key based on selection mode."""
@@ -897,45 +1146,32 @@ class SwapActionPanel(ActionPanel):
 
     def add_swap(self):
         """Add the swap action."""
-        required = ["player1", "player2", "init_pos1", "init_pos2", "final_pos1", "final_pos2"]
-        if not all(k in self.selections for k in required):
-            messagebox.showwarning("Incomplete", "Please complete all fields (Initial and Final positions for both players)")
+        if not self.selections.keys() >= {"player1", "player2", "init_pos1", "init_pos2", "final_pos1", "final_pos2"}:
+            self.warn("Please complete all fields (Initial and Final positions for both players)")
             return
         
-        p1_id = self.selections["player1"]
-        p2_id = self.selections["player2"]
-        p1 = self.app.player_names[p1_id]
-        p2 = self.app.player_names[p2_id]
+        sel = self.selections
+        names = self.app.player_names
+        p1_id = sel["player1"]
+        p2_id = sel["player2"]
         
         # Check if I'm involved in the swap
-        i_am_involved = (p1_id == self.app.my_player_id or p2_id == self.app.my_player_id)
+        my_player_id = self.app.my_player_id
+        i_am_involved = (p1_id == my_player_id or p2_id == my_player_id)
         
         # If I'm involved, received_value is required
-        if i_am_involved and "received_value" not in self.selections:
-            messagebox.showwarning("Incomplete", "Please select the value you received (since you're involved in the swap)")
+        if i_am_involved and "received_value" not in sel:
+            self.warn("Please select the value you received (since you're involved in the swap)")
             return
         
         # Convert to 1-indexed and build action tuple
+        action = (names[p1_id], names[p2_id],
+                  sel["init_pos1"] + 1, sel["init_pos2"] + 1,
+                  sel["final_pos1"] + 1, sel["final_pos2"] + 1)
         if i_am_involved:
-            action = (
-                p1, p2,
-                self.selections["init_pos1"] + 1,
-                self.selections["init_pos2"] + 1,
-                self.selections["final_pos1"] + 1,
-                self.selections["final_pos2"] + 1,
-                self.selections["received_value"]
-            )
-        else:
-            action = (
-                p1, p2,
-                self.selections["init_pos1"] + 1,
-                self.selections["init_pos2"] + 1,
-                self.selections["final_pos1"] + 1,
-                self.selections["final_pos2"] + 1
-            )
+            action += (sel["received_value"],)
         
-        self.app.add_action("swap", action)
-        self.clear()
+        self.queue_action("swap", action)
     
     def clear(self):
         """Clear all selections."""
@@ -951,13 +1187,12 @@ class DoubleRevealActionPanel(ActionPanel):
         super().__init__(parent, app)
         self.hand_viewer_frame = True  # Flag to enable hand viewing
         
-        tk.Label(self, text="DOUBLE REVEAL ACTION", font=("Arial", 14, "bold"), fg="#333333").pack(pady=10)
+        self.create_title("DOUBLE REVEAL ACTION")
         
         self.create_player_buttons(self, "Player:", "player")
         
         # Hand viewer for player (visual reference only)
-        self.player_hand_frame = tk.Frame(self)
-        self.player_hand_frame.pack(fill=tk.X, pady=5, padx=10)
+        self.player_hand_frame = self.create_hand_frame("player")
         
         # Show which positions are selected
         self.position_status_frame = tk.Frame(self)
@@ -972,16 +1207,10 @@ class DoubleRevealActionPanel(ActionPanel):
         
         self.create_value_buttons(self, "Value:", "value")
         
-        tk.Label(self, text="ℹ️ Use when revealing the last 2 copies of a value",
-                font=("Arial", 9, "italic"), fg="#666666").pack(pady=5)
+        self.create_hint("ℹ️ Use when revealing the last 2 copies of a value")
         
         # Buttons
-        button_frame = tk.Frame(self)
-        button_frame.pack(pady=20)
-        tk.Button(button_frame, text="ADD DOUBLE REVEAL", command=self.add_reveal,
-                 bg="#4CAF50", fg="white", padx=30, pady=10, font=("Arial", 11, "bold")).pack(side=tk.LEFT, padx=10)
-        tk.Button(button_frame, text="CLEAR", command=self.clear,
-                 bg="#F44336", fg="white", padx=20, pady=10, font=("Arial", 11, "bold")).pack(side=tk.LEFT, padx=10)
+        self.create_action_buttons("ADD DOUBLE REVEAL", self.add_reveal)
     
     def handle_hand_click(self, player_key, position):
         """Handle click on hand for double reveal (toggle 2 positions)."""
@@ -1016,20 +1245,15 @@ class DoubleRevealActionPanel(ActionPanel):
 
     def add_reveal(self):
         """Add the double reveal action."""
-        required = ["player", "value", "position1", "position2"]
-        if not all(k in self.selections for k in required):
-            messagebox.showwarning("Incomplete", "Please complete all fields")
+        if not self.selections.keys() >= {"player", "value", "position1", "position2"}:
+            self.warn("Please complete all fields")
             return
         
-        player = self.app.player_names[self.selections["player"]]
-        value = self.selections["value"]
-        pos1 = self.selections["position1"] + 1
-        pos2 = self.selections["position2"] + 1
-        
-        action = (player, value, pos1, pos2)
+        sel = self.selections
+        action = (self.app.player_names[sel["player"]], sel["value"],
+                  sel["position1"] + 1, sel["position2"] + 1)
         
-        self.app.add_action("double_reveal", action)
-        self.clear()
+        self.queue_action("double_reveal", action)
     
     def clear(self):
         """Clear all selections."""
@@ -1044,13 +1268,12 @@ class SignalActionPanel(ActionPanel):
         super().__init__(parent, app)
         self.hand_viewer_frame = True  # Flag to enable hand viewing
         
-        tk.Label(self, text="SIGNAL ACTION", font=("Arial", 14, "bold"), fg="#333333").pack(pady=10)
+        self.create_title("SIGNAL ACTION")
         
         self.create_player_buttons(self, "Player:", "player")
         
         # Hand viewer for player (visual reference only)
-        self.player_hand_frame = tk.Frame(self)
-        self.player_hand_frame.pack(fill=tk.X, pady=5, padx=10)
+        self.player_hand_frame = self.create_hand_frame("player")
         
         # Position selection buttons
         self.init_position_var("position")
@@ -1068,34 +1291,23 @@ class SignalActionPanel(ActionPanel):
         tk.Radiobutton(type_frame, text="REVEAL (Show)", variable=self.action_type_var, 
                       value="reveal", bg="#E8F5E9", font=("Arial", 10)).pack(side=tk.LEFT, padx=10)
         
-        tk.Label(self, text="ℹ️ Use SIGNAL when deduced, REVEAL when shown to others",
-                font=("Arial", 9, "italic"), fg="#666666").pack(pady=5)
+        self.create_hint("ℹ️ Use SIGNAL when deduced, REVEAL when shown to others")
         
         # Buttons
-        button_frame = tk.Frame(self)
-        button_frame.pack(pady=20)
-        tk.Button(button_frame, text="ADD ACTION", command=self.add_signal,
-                 bg="#4CAF50", fg="white", padx=30, pady=10, font=("Arial", 11, "bold")).pack(side=tk.LEFT, padx=10)
-        tk.Button(button_frame, text="CLEAR", command=self.clear,
-                 bg="#F44336", fg="white", padx=20, pady=10, font=("Arial", 11, "bold")).pack(side=tk.LEFT, padx=10)
+        self.create_action_buttons("ADD ACTION", self.add_signal)
     
     def add_signal(self):
         """Add the signal or reveal action."""
-        required = ["player", "value", "position"]
-        if not all(k in self.selections for k in required):
-            messagebox.showwarning("Incomplete", "Please complete all fields")
+        if not self.selections.keys() >= {"player", "value", "position"}:
+            self.warn("Please complete all fields")
             return
         
-        player = self.app.player_names[self.selections["player"]]
-        value = self.selections["value"]
-        position = self.selections["position"] + 1
-        
-        action = (player, value, position)
+        sel = self.selections
+        action = (self.app.player_names[sel["player"]], sel["value"], sel["position"] + 1)
         
         # Determine action type based on radio button selection
         action_type = self.action_type_var.get()
-        self.app.add_action(action_type, action)
-        self.clear()
+        self.queue_action(action_type, action)
     
     def clear(self):
         """Clear all selections."""
@@ -1110,7 +1322,7 @@ class AdvancedSignalsPanel(ActionPanel):
         super().__init__(parent, app)
         self.hand_viewer_frame = True
         
-        tk.Label(self, text="ADVANCED SIGNALS", font=("Arial", 14, "bold"), fg="#333333").pack(pady=10)
+        self.create_title("ADVANCED SIGNALS")
         
         # Signal type selector
         type_frame = tk.Frame(self, bg="#E3F2FD", padx=10, pady=10, relief=tk.GROOVE, borderwidth=2)
@@ -1132,8 +1344,7 @@ class AdvancedSignalsPanel(ActionPanel):
         self.create_player_buttons(self, "Player:", "player")
         
         # Hand viewer
-        self.player_hand_frame = tk.Frame(self)
-        self.player_hand_frame.pack(fill=tk.X, pady=5, padx=10)
+        self.player_hand_frame = self.create_hand_frame("player")
         
         # Copy count selection (only for multipliers)
         self.copy_count_frame = tk.Frame(self, bg="#FFF9C4", padx=10, pady=10, relief=tk.GROOVE, borderwidth=1)
@@ -1154,12 +1365,7 @@ class AdvancedSignalsPanel(ActionPanel):
         self.init_position_var("position2")
         
         # Buttons
-        button_frame = tk.Frame(self)
-        button_frame.pack(pady=20)
-        tk.Button(button_frame, text="ADD SIGNAL", command=self.add_advanced_signal,
-                 bg="#4CAF50", fg="white", padx=30, pady=10, font=("Arial", 11, "bold")).pack(side=tk.LEFT, padx=10)
-        tk.Button(button_frame, text="CLEAR", command=self.clear,
-                 bg="#F44336", fg="white", padx=20, pady=10, font=("Arial", 11, "bold")).pack(side=tk.LEFT, padx=10)
+        self.create_action_buttons("ADD SIGNAL", self.add_advanced_signal)
         
         # Initialize UI state
         self.on_signal_type_changed()
@@ -1268,7 +1474,7 @@ class AdvancedSignalsPanel(ActionPanel):
         signal_type = self.signal_type_var.get()
         
         if "player" not in self.selections:
-            messagebox.showwarning("Incomplete", "Please select a player")
+            self.warn("Please select a player")
             return
         
         player_id = self.selections["player"]
@@ -1277,7 +1483,7 @@ class AdvancedSignalsPanel(ActionPanel):
         if signal_type == "copy_count":
             # Copy count signal
             if "position1" not in self.selections:
-                messagebox.showwarning("Incomplete", "Please select a position")
+                self.warn("Please select a position")
                 return
             
             position = self.selections["position1"]  # Already 0-indexed
@@ -1285,13 +1491,12 @@ class AdvancedSignalsPanel(ActionPanel):
             
             # Store as tuple: (player_id, position_0indexed, copy_count)
             action = (player_id, position, copy_count)
-            self.app.add_action("copy_count_signal", action)
-            self.clear()
+            self.queue_action("copy_count_signal", action)
         
         else:
             # Adjacent signal (equal or different)
             if "position1" not in self.selections or "position2" not in self.selections:
-                messagebox.showwarning("Incomplete", "Please select both positions")
+                self.warn("Please select both positions")
                 return
             
             pos1 = self.selections["position1"]
@@ -1299,15 +1504,14 @@ class AdvancedSignalsPanel(ActionPanel):
             
             # Validate adjacent
             if abs(pos1 - pos2) != 1:
-                messagebox.showwarning("Invalid", "Positions must be adjacent (differ by 1)")
+                self.warn("Positions must be adjacent (differ by 1)")
                 return
             
             is_equal = (signal_type == "equal")
             
             # Store as tuple: (player_id, pos1_0indexed, pos2_0indexed, is_equal)
             action = (player_id, pos1, pos2, is_equal)
-            self.app.add_action("adjacent_signal", action)
-            self.clear()
+            self.queue_action("adjacent_signal", action)
     
     def clear(self):
         """Clear all selections."""
@@ -1324,13 +1528,12 @@ class NotPresentActionPanel(ActionPanel):
         super().__init__(parent, app)
         self.hand_viewer_frame = True  # Flag to enable hand viewing
         
-        tk.Label(self, text="NOT PRESENT ACTION", font=("Arial", 14, "bold"), fg="#333333").pack(pady=10)
+        self.create_title("NOT PRESENT ACTION")
         
         self.create_player_buttons(self, "Player:", "player")
         
         # Hand viewer for player
-        self.player_hand_frame = tk.Frame(self)
-        self.player_hand_frame.pack(fill=tk.X, pady=5, padx=10)
+        self.player_hand_frame = self.create_hand_frame("player")
         
         # Scope selector
         scope_frame = tk.Frame(self, bg="#E8F5E9", padx=10, pady=10, relief=tk.GROOVE, borderwidth=1)
@@ -1349,16 +1552,10 @@ class NotPresentActionPanel(ActionPanel):
         # Multi-select value buttons
         self.create_multi_value_buttons(self, "Values (Select multiple):")
         
-        tk.Label(self, text="ℹ️ Use when a player announces they don't have this value",
-                font=("Arial", 9, "italic"), fg="#666666").pack(pady=5)
+        self.create_hint("ℹ️ Use when a player announces they don't have this value")
         
         # Buttons
-        button_frame = tk.Frame(self)
-        button_frame.pack(pady=20)
-        tk.Button(button_frame, text="ADD NOT PRESENT", command=self.add_not_present,
-                 bg="#4CAF50", fg="white", padx=30, pady=10, font=("Arial", 11, "bold")).pack(side=tk.LEFT, padx=10)
-        tk.Button(button_frame, text="CLEAR", command=self.clear,
-                 bg="#F44336", fg="white", padx=20, pady=10, font=("Arial", 11, "bold")).pack(side=tk.LEFT, padx=10)
+        self.create_action_buttons("ADD NOT PRESENT", self.add_not_present)
         
         # Initial state
         self.toggle_position_selection()
@@ -1418,6 +1615,12 @@ class NotPresentActionPanel(ActionPanel):
                         if value in self.selected_values:
                             self.selected_values.remove(value)
 
+    def deselect_accepted(self, actions):
+        """Deselect the values whose not-present actions were already added."""
+        for action in actions:
+            self.selected_values.discard(action[1])
+        self.update_value_buttons_state()
+    
     def select_player(self, key, player_id):
         super().select_player(key, player_id)
         self.update_value_buttons_state()
@@ -1443,29 +1646,28 @@ class NotPresentActionPanel(ActionPanel):
     def add_not_present(self):
         """Add the not present action."""
         if not "player" in self.selections:
-            messagebox.showwarning("Incomplete", "Please select a player")
+            self.warn("Please select a player")
             return
             
         if not self.selected_values:
-            messagebox.showwarning("Incomplete", "Please select at least one value")
+            self.warn("Please select at least one value")
             return
 
         if self.scope_var.get() == "specific" and "position" not in self.selections:
-             messagebox.showwarning("Incomplete", "Please select a position from the hand")
-             return
+            self.warn("Please select a position from the hand")
+            return
         
         player = self.app.player_names[self.selections["player"]]
         
+        actions = []
         for value in list(self.selected_values):
             if self.scope_var.get() == "specific":
                 position = self.selections["position"] + 1  # Convert to 1-based for consistency
-                action = (player, value, position)
+                actions.append((player, value, position))
             else:
-                action = (player, value)
-            
-            self.app.add_action("not_present", action)
-            
-        self.clear()
+                actions.append((player, value))
+        
+        self.queue_action("not_present", *actions)
     
     def clear(self):
         """Clear all selections."""
@@ -1481,41 +1683,30 @@ class HasValueActionPanel(ActionPanel):
         super().__init__(parent, app)
         self.hand_viewer_frame = True  # Flag to enable hand viewing
         
-        tk.Label(self, text="HAS VALUE ACTION", font=("Arial", 14, "bold"), fg="#333333").pack(pady=10)
+        self.create_title("HAS VALUE ACTION")
         
         self.create_player_buttons(self, "Player:", "player")
         
         # Hand viewer for player
-        self.player_hand_frame = tk.Frame(self)
-        self.player_hand_frame.pack(fill=tk.X, pady=5, padx=10)
+        self.player_hand_frame = self.create_hand_frame("player")
         
         self.create_value_buttons(self, "Value:", "value")
         
-        tk.Label(self, text="ℹ️ Use when a player announces they have this value (position unknown)",
-                font=("Arial", 9, "italic"), fg="#666666").pack(pady=5)
+        self.create_hint("ℹ️ Use when a player announces they have this value (position unknown)")
         
         # Buttons
-        button_frame = tk.Frame(self)
-        button_frame.pack(pady=20)
-        tk.Button(button_frame, text="ADD HAS VALUE", command=self.add_has_value,
-                 bg="#4CAF50", fg="white", padx=30, pady=10, font=("Arial", 11, "bold")).pack(side=tk.LEFT, padx=10)
-        tk.Button(button_frame, text="CLEAR", command=self.clear,
-                 bg="#F44336", fg="white", padx=20, pady=10, font=("Arial", 11, "bold")).pack(side=tk.LEFT, padx=10)
+        self.create_action_buttons("ADD HAS VALUE", self.add_has_value)
     
     def add_has_value(self):
         """Add the has value action."""
-        required = ["player", "value"]
-        if not all(k in self.selections for k in required):
-            messagebox.showwarning("Incomplete", "Please complete all fields")
+        if not self.selections.keys() >= {"player", "value"}:
+            self.warn("Please complete all fields")
             return
         
-        player = self.app.player_names[self.selections["player"]]
-        value = self.selections["value"]
+        sel = self.selections
+        action = (self.app.player_names[sel["player"]], sel["value"])
         
-        action = (player, value)
-        
-        self.app.add_action("has_value", action)
-        self.clear()
+        self.queue_action("has_value", action)
     
     def clear(self):
         """Clear all selections."""
@@ -1586,23 +1777,21 @@ class SuggesterPanel(tk.Frame):
             # Deselect if already selected
             self.clear_value_filter()
         else:
+            # Update button styles (only the previous and the new selection change)
+            if self.selected_filter_value is not None:
+                self.value_filter_buttons[self.selected_filter_value].config(bg="white", fg="black", relief=tk.RAISED)
+            self.value_filter_buttons[value].config(bg="#BD10E0", fg="white", relief=tk.SUNKEN)
             # Select new value
             self.selected_filter_value = value
-            # Update button styles
-            for v, btn in self.value_filter_buttons.items():
-                if v == value:
-                    btn.config(bg="#BD10E0", fg="white", relief=tk.SUNKEN)
-                else:
-                    btn.config(bg="white", fg="black", relief=tk.RAISED)
             # Refresh display
             self.refresh()
     
     def clear_value_filter(self):
         """Clear the value filter."""
+        # Reset the selected button's style
+        if self.selected_filter_value is not None:
+            self.value_filter_buttons[self.selected_filter_value].config(bg="white", fg="black", relief=tk.RAISED)
         self.selected_filter_value = None
-        # Reset all button styles
-        for btn in self.value_filter_buttons.values():
-            btn.config(bg="white", fg="black", relief=tk.RAISED)
         # Refresh display
         self.refresh()
     
@@ -1621,7 +1810,7 @@ class SuggesterPanel(tk.Frame):
                 
                 # Check certain positions (not yet revealed)
                 for player_id, position in tracker.certain:
-                    if (player_id, position) not in tracker.revealed:
+                    if not tracker.is_revealed(player_id, position):
                         non_revealed_positions.append((player_id, position))
                 
                 # Check if all non-revealed positions are in my hand
@@ -1662,6 +1851,10 @@ class SuggesterPanel(tk.Frame):
             messagebox.showwarning("No Game", "No active game to analyze")
             return
         
+        if self.app.rebuild_in_progress():
+            self.app.show_status("⏳ Game state is being rebuilt, try again in a moment")
+            return
+        
         # Apply filters first
         self.app.my_player.belief_system.apply_filters()
         
@@ -1686,14 +1879,16 @@ class SuggesterPanel(tk.Frame):
         progress_bar = tk.ttk.Progressbar(progress_window, length=350, mode='determinate')
         progress_bar.pack(pady=10)
         
-        progress_window.update()
+        # Draw the window without processing events (see update_progress)
+        progress_window.update_idletasks()
         
         # Define progress callback
         def update_progress(current, total, message):
             if total > 0:
                 progress_bar['value'] = (current / total) * 100
             progress_label.config(text=message)
-            progress_window.update()
+            # Redraw only; processing events here could re-enter the app mid-analysis
+            progress_window.update_idletasks()
         
         try:
             # Run entropy analysis with progress callback
@@ -1760,6 +1955,10 @@ class SuggesterPanel(tk.Frame):
             messagebox.showwarning("No Game", "No active game to analyze")
             return
         
+        if self.app.rebuild_in_progress():
+            self.app.show_status("⏳ Game state is being rebuilt, try again in a moment")
+            return
+        
         # Apply filters first
         self.app.my_player.belief_system.apply_filters()
         
@@ -1859,6 +2058,10 @@ class SuggesterPanel(tk.Frame):
 
     def refresh(self):
         """Refresh the suggestions list."""
+        if self.app.rebuild_in_progress():
+            # Keep the current list; _poll_rebuild refreshes it with the new game
+            return
+        
         # Clear existing items
         for widget in self.content_frame.winfo_children():
             widget.destroy()
@@ -1974,6 +2177,10 @@ class EntropyPanel(tk.Frame):
 
     def refresh(self):
         """Refresh the entropy display."""
+        if self.app.rebuild_in_progress():
+            # Keep the current stats; _poll_rebuild refreshes them with the new game
+            return
+        
         # Clear existing content
         for widget in self.content_frame.winfo_children():
             widget.destroy()
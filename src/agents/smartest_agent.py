@@ -62,18 +62,11 @@ class SmartestAgent(BaseAgent):
             # Count how many of this value I have
             my_count = 0
             my_positions = []
-            for pos, val in enumerate(self.player.wire):
-                if val == value:
-                    # Check if this position is not already revealed
-                    is_revealed = False
-                    for revealed_pid, revealed_pos in tracker.revealed:
-                        if revealed_pid == self.player.player_id and revealed_pos == pos:
-                            is_revealed = True
-                            break
-                    
-                    if not is_revealed:
-                        my_count += 1
-                        my_positions.append(pos)
+            for pos in self.player.positions_by_value.get(value, ()):
+                # Check if this position is not already revealed
+                if not tracker.is_revealed(self.player.player_id, pos):
+                    my_count += 1
+                    my_positions.append(pos)
             
             # Check if I have the last remaining wires for this value
             if my_count + revealed_count == total_copies and my_count >= 2:
@@ -9,8 +9,22 @@ from itertools import combinations
 from src.data_structures import CallRecord, DoubleRevealRecord, SwapRecord, SignalRecord, NotPresentRecord, SignalCopyCountRecord, SignalAdjacentRecord, GameObservation, ValueTracker
 from config.game_config import GameConfig
 import json
+import sys
+import threading
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+# Parser for saved state files (orjson is a drop-in, faster json.loads)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Serializes belief folder reads and writes; the IRL GUI replays the session
+# on a worker thread while the Tk thread may auto-save filtered beliefs
+_folder_lock = threading.Lock()
+
 
 class BeliefModel:
     """
@@ -51,6 +65,14 @@ class BeliefModel:
         # Constraint tracking for adjacent signals
         # Key: (player_id, pos1, pos2), Value: is_equal (True if same, False if different)
         self.adjacent_constraints: Dict[Tuple[int, int, int], bool] = {}
+        
+        # Incremented whenever beliefs may have changed (observations, effective filtering).
+        # Lets callers cache values derived from the beliefs, e.g. entropy.
+        self.version = 0
+        # Version at the end of the last apply_filters() run (see apply_filters_if_stale)
+        self._last_filtered_version = -1
+        # (version, entropy) of the last system_entropy() result for these beliefs
+        self._cached_entropy: Tuple[int, float] = (-1, 0.0)
         # Initialize value trackers
         self._initialize_value_trackers()
         
@@ -95,6 +117,7 @@ class BeliefModel:
         Args:
             call_record: The call to process
         """
+        self.version += 1
         if call_record.success:
             self._process_successful_call(call_record)
         else:
@@ -112,6 +135,7 @@ class BeliefModel:
         Args:
             reveal_record: The double reveal to process
         """
+        self.version += 1
         player_id = reveal_record.player_id
         value = reveal_record.value
         pos1 = reveal_record.position1
@@ -137,6 +161,7 @@ class BeliefModel:
         Args:
             signal_record: The signal to process
         """
+        self.version += 1
         player_id = signal_record.player_id
         value = signal_record.value
         position = signal_record.position
@@ -159,6 +184,7 @@ class BeliefModel:
         Args:
             signal_record: The reveal action (uses SignalRecord structure)
         """
+        self.version += 1
         player_id = signal_record.player_id
         value = signal_record.value
         position = signal_record.position
@@ -182,6 +208,7 @@ class BeliefModel:
         Args:
             not_present_record: The not-present announcement to process
         """
+        self.version += 1
         player_id = not_present_record.player_id
         value = not_present_record.value
         position = not_present_record.position
@@ -202,6 +229,26 @@ class BeliefModel:
         if self.config.auto_filter:
             self.apply_filters()
     
+    def bulk_discard(self, player_id: int, positions: Tuple[int, ...], value: Union[int, float]):
+        """
+        Remove a value from several positions of a player's wire in one call.
+        Unlike process_not_present this does not run the filters and may empty a set.
+        
+        Args:
+            player_id: The player whose positions are updated
+            positions: Wire positions (0-indexed) that cannot hold the value
+            value: The value to remove
+        """
+        player_beliefs = self.beliefs[player_id]
+        changed = False
+        for position in positions:
+            possible = player_beliefs[position]
+            if value in possible:
+                possible.discard(value)
+                changed = True
+        if changed:
+            self.version += 1
+    
     def process_has_value(self, player_id: int, value: Union[int, float]):
         """
         Update beliefs based on a player announcing they have a specific value.
@@ -211,6 +258,7 @@ class BeliefModel:
             player_id: The player who has the value
             value: The value they have
         """
+        self.version += 1
         # Only update if this is not my own announcement (I already know my wire)
         if player_id != self.my_player_id:
             self.value_trackers[value].add_called(player_id)
@@ -227,6 +275,7 @@ class BeliefModel:
         Args:
             signal_record: The copy count signal to process
         """
+        self.version += 1
         player_id = signal_record.player_id
         position = signal_record.position
         copy_count = signal_record.copy_count
@@ -258,6 +307,7 @@ class BeliefModel:
         Args:
             signal_record: The adjacent signal to process
         """
+        self.version += 1
         player_id = signal_record.player_id
         pos1 = signal_record.position1
         pos2 = signal_record.position2
@@ -307,6 +357,7 @@ class BeliefModel:
         Args:
             swap_record: The swap to process
         """
+        self.version += 1
         p1_id = swap_record.player1_id
         p2_id = swap_record.player2_id
         p1_init = swap_record.player1_init_pos
@@ -566,6 +617,7 @@ class BeliefModel:
         """
         max_iterations = 100  # Prevent infinite loops
         iteration = 0
+        any_changed = False
         
         while iteration < max_iterations:
             changed = False
@@ -597,11 +649,15 @@ class BeliefModel:
             # If no changes, we've reached a fixed point
             if not changed:
                 break
+            any_changed = True
             
             iteration += 1
         
         if iteration >= max_iterations:
             print(f"⚠️  Warning: apply_filters() reached max iterations ({max_iterations})")
+        
+        if any_changed:
+            self.version += 1
             
         
         # After filtering, update ValueTracker for any newly certain positions
@@ -618,6 +674,42 @@ class BeliefModel:
             except Exception as e:
                 print(f"Warning: Failed to auto-save belief state: {e}")
     
+    def system_entropy(self) -> float:
+        """
+        Total entropy of the beliefs, in bits (see GameStatistics.calculate_system_entropy).
+        
+        Cached per version, so calls with unchanged beliefs are free.
+        """
+        version, entropy = self._cached_entropy
+        if version == self.version:
+            return entropy
+        # Imported here: src.statistics imports this module
+        from src.statistics import GameStatistics
+        entropy = GameStatistics(self, self.config).calculate_system_entropy()
+        self._cached_entropy = (self.version, entropy)
+        return entropy
+    
+    @property
+    def dirty(self) -> bool:
+        """True if the beliefs changed since the last apply_filters_if_stale() run."""
+        return self._last_filtered_version != self.version
+    
+    def apply_filters_if_stale(self) -> bool:
+        """
+        Apply filters only if the beliefs changed since the last filtering run.
+        
+        The filters run to a fixed point, so with no new observation in between
+        a second run would recompute the same beliefs.
+        
+        Returns:
+            True if the filters were run
+        """
+        if not self.dirty:
+            return False
+        self.apply_filters()
+        self._last_filtered_version = self.version
+        return True
+    
     def _update_value_trackers(self):
         """
         Update ValueTracker when belief sets become size 1 (certain).
@@ -638,7 +730,7 @@ class BeliefModel:
                     tracker = self.value_trackers[value]
                     
                     # Only add to certain if not already tracked for this position
-                    if not any(p == player_id and pos == position for p, pos in tracker.revealed):
+                    if not tracker.is_revealed(player_id, position):
                         if not any(p == player_id and pos == position for p, pos in tracker.certain):
                             tracker.add_certain(player_id, position)
     
@@ -751,23 +843,16 @@ class BeliefModel:
                 if window_size >= W:
                     continue
                 
-                # Find all valid window positions (windows that contain all required positions)
-                valid_positions = set()
-                
-                # Slide the window across all possible starting positions
-                for window_start in range(W - window_size + 1):
-                    window_end = window_start + window_size - 1  # inclusive
-                    
-                    # Check if this window contains all required positions
-                    window_contains_all = all(
-                        window_start <= pos <= window_end 
-                        for pos in required_positions
-                    )
-                    
-                    if window_contains_all:
-                        # All positions in this window are valid for this value
-                        for pos in range(window_start, window_end + 1):
-                            valid_positions.add(pos)
+                # Find all valid window positions (windows that contain all required positions).
+                # A window starting at s contains them iff s <= min(required) and
+                # s + window_size - 1 >= max(required), so the valid starts form one
+                # contiguous range and their union is a single index range.
+                first_start = max(0, max(required_positions) - window_size + 1)
+                last_start = min(min(required_positions), W - window_size)
+                if first_start <= last_start:
+                    valid_positions = range(first_start, last_start + window_size)
+                else:
+                    valid_positions = range(0)
                 
                 # Remove this value from all positions NOT in valid_positions
                 for pos in range(W):
@@ -1216,25 +1301,27 @@ class BeliefModel:
         Args:
             player_names: Optional dict mapping player IDs to names {0: "Alice", 1: "Bob", ...}
         """
+        # Collect the report and write it once instead of one print per position
+        lines = []
         my_name = player_names.get(self.my_player_id, f"Player {self.my_player_id}") if player_names else f"Player {self.my_player_id}"
-        print(f"\nBelief State (from {my_name}'s perspective):")
-        print("-" * 80)
+        lines.append(f"\nBelief State (from {my_name}'s perspective):")
+        lines.append("-" * 80)
         
         for player_id in range(self.config.n_players):
             player_name = player_names.get(player_id, f"Player {player_id}") if player_names else f"Player {player_id}"
             
             if player_id == self.my_player_id:
-                print(f"\n👤 {player_name} (YOU):")
+                lines.append(f"\n👤 {player_name} (YOU):")
             else:
-                print(f"\n{player_name}:")
+                lines.append(f"\n{player_name}:")
             
             for position in range(self.config.wires_per_player):
                 possible_values = self.beliefs[player_id][position]
                 
                 if len(possible_values) == 0:
-                    print(f"  Position {position+1}: ⚠️  INCONSISTENT - No possible values!")
+                    lines.append(f"  Position {position+1}: ⚠️  INCONSISTENT - No possible values!")
                 elif len(possible_values) == 1:
-                    value = list(possible_values)[0]
+                    value = next(iter(possible_values))
                     
                     # Check if this position is revealed or just certain
                     is_revealed = False
@@ -1243,24 +1330,25 @@ class BeliefModel:
                     if value in self.value_trackers:
                         tracker = self.value_trackers[value]
                         # Check if this specific position is revealed
-                        if any(p == player_id and pos == position for p, pos in tracker.revealed):
+                        if tracker.is_revealed(player_id, position):
                             is_revealed = True
                         # Check if this specific position is certain
-                        elif any(p == player_id and pos == position for p, pos in tracker.certain):
+                        elif (player_id, position) in tracker.certain:
                             is_certain = True
                     
                     if is_revealed:
-                        print(f"  Position {position+1}: [{value}] 🔓 REVEALED ")
+                        lines.append(f"  Position {position+1}: [{value}] 🔓 REVEALED ")
                     elif is_certain:
-                        print(f"  Position {position+1}: [{value}] ✓ CERTAIN")
+                        lines.append(f"  Position {position+1}: [{value}] ✓ CERTAIN")
                     else:
                         # Single value but not tracked (shouldn't happen normally)
-                        print(f"  Position {position+1}: [{value}] ✓ WTF")
+                        lines.append(f"  Position {position+1}: [{value}] ✓ WTF")
                 else:
                     values_str = str(sorted(possible_values))
-                    print(f"  Position {position+1}: {values_str} ({len(possible_values)} possibilities)")
+                    lines.append(f"  Position {position+1}: {values_str} ({len(possible_values)} possibilities)")
         
-        print("-" * 80)
+        lines.append("-" * 80)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # --- Serialization helpers -------------------------------------------------
     def to_dict(self) -> Dict:
@@ -1392,14 +1480,18 @@ class BeliefModel:
         if player_names:
             belief_data["player_names"] = player_names
         
-        with belief_file.open("w", encoding="utf-8") as fh:
-            json.dump(belief_data, fh, indent=2)
+        # Serialize in memory and write once (json.dump issues a write per chunk)
+        belief_text = json.dumps(belief_data, indent=2)
 
         # Write value trackers separately for readability
         vt_file = player_dir / "value_tracker.json"
         vt_serialized = {str(v): t.to_dict(player_names) for v, t in self.value_trackers.items()}
-        with vt_file.open("w", encoding="utf-8") as fh:
-            json.dump(vt_serialized, fh, indent=2)
+        vt_text = json.dumps(vt_serialized, indent=2)
+        
+        # Write both files under the lock so a snapshot is never interleaved
+        with _folder_lock:
+            belief_file.write_text(belief_text, encoding="utf-8")
+            vt_file.write_text(vt_text, encoding="utf-8")
 
     @classmethod
     def load_from_folder(cls, base_path: str, player_id: int, observation: GameObservation, config: GameConfig) -> "BeliefModel":
@@ -1410,13 +1502,20 @@ class BeliefModel:
         base = Path(base_path)
         player_dir = base / f"player_{player_id}"
         
-        # Load belief data
         belief_file = player_dir / "belief.json"
-        if not belief_file.exists():
-            raise FileNotFoundError(f"Belief file not found: {belief_file}")
+        vt_file = player_dir / "value_tracker.json"
         
-        with belief_file.open("r", encoding="utf-8") as fh:
-            belief_data = json.load(fh)
+        # Read both files under the lock so they come from the same snapshot
+        with _folder_lock:
+            if not belief_file.exists():
+                raise FileNotFoundError(f"Belief file not found: {belief_file}")
+            if not vt_file.exists():
+                raise FileNotFoundError(f"Value tracker file not found: {vt_file}")
+            belief_bytes = belief_file.read_bytes()
+            vt_bytes = vt_file.read_bytes()
+        
+        # Load belief data
+        belief_data = _json_loads(belief_bytes)
         
         # Extract player names if available (for reference, not used in loading)
         player_names = belief_data.get("player_names", {})
@@ -1434,12 +1533,7 @@ class BeliefModel:
             beliefs_dict[str(pid)] = pos_map
         
         # Load value tracker data
-        vt_file = player_dir / "value_tracker.json"
-        if not vt_file.exists():
-            raise FileNotFoundError(f"Value tracker file not found: {vt_file}")
-        
-        with vt_file.open("r", encoding="utf-8") as fh:
-            vt_data = json.load(fh)
+        vt_data = _json_loads(vt_bytes)
         
         # Combine both into the format expected by from_dict
         combined_data = {
@@ -1463,6 +1557,11 @@ class BeliefModel:
         new_model.my_player_id = self.my_player_id
         new_model.observation = self.observation
         new_model.config = self.config
+        new_model.version = self.version
+        # Clones are edited in place (entropy_suggester) without bumping the version,
+        # so the filter and entropy caches start empty rather than being inherited
+        new_model._last_filtered_version = -1
+        new_model._cached_entropy = (-1, 0.0)
         
         # Deep copy beliefs
         new_model.beliefs = {}
@@ -107,7 +107,7 @@ class EntropySuggester:
             - 'time_taken': Execution time in seconds
             - 'details': List of all analyzed calls with their scores
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # 1. Get candidate calls
         candidates = self._get_candidate_calls(max_uncertainty)
@@ -117,7 +117,7 @@ class EntropySuggester:
                 'best_call': None,
                 'expected_entropy': 0,
                 'information_gain': 0,
-                'time_taken': time.time() - start_time,
+                'time_taken': time.perf_counter() - start_time,
                 'candidates_analyzed': 0,
                 'details': []
             }
@@ -145,7 +145,7 @@ class EntropySuggester:
             'expected_entropy': best_result['expected_entropy'] if best_result else 0,
             'information_gain': best_result['info_gain'] if best_result else 0,
             'candidates_analyzed': len(results),
-            'time_taken': time.time() - start_time,
+            'time_taken': time.perf_counter() - start_time,
             'details': results
         }
     
@@ -6,17 +6,24 @@ import collections
 from concurrent.futures import ProcessPoolExecutor
 from src.belief.global_belief_utils import generate_signatures_worker
 import multiprocessing as mp
+import threading
 
 COMPLEXITY_THRESHOLD = 10000
 
 _executor = None
+_executor_lock = threading.Lock()
 _n_workers = max(1, mp.cpu_count() - 1)
 
+
 def get_executor():
     global _executor
-    if _executor is None:
-        _executor = ProcessPoolExecutor(max_workers=_n_workers)
-    return _executor
+    # Locked so two threads (e.g. the IRL GUI's Tk thread and its rebuild
+    # worker) never each create a pool
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=_n_workers)
+        return _executor
+
 
 class GlobalBeliefModel(BeliefModel):
     """
@@ -229,15 +236,22 @@ class GlobalBeliefModel(BeliefModel):
         
         results = [f.result() for f in futures]
         
+        changed = False
         for p, (new_domains, valid_hands) in enumerate(results):
             self.valid_hands[p] = valid_hands
             
             for pos in range(self.config.wires_per_player):
+                before_size = len(self.beliefs[p][pos])
                 self.beliefs[p][pos] &= new_domains[pos]
+                if len(self.beliefs[p][pos]) < before_size:
+                    changed = True
                 
                 if not self.beliefs[p][pos]:
                     print(f"CRITICAL: Belief for P{p} Pos{pos} became empty during projection!")
         
+        if changed:
+            self.version += 1
+        
         return True
 
     def _get_min_counts(self, player_id: int) -> Dict[Union[int, float], int]:
@@ -320,6 +334,7 @@ class GlobalBeliefModel(BeliefModel):
         """
         beliefs = self.beliefs[player_id]
         hand_size = self.config.wires_per_player
+        get_copies = self.config.get_copies
         valid_hands = []
         
         def backtrack(pos: int, current_hand: List, current_counts: Dict):
@@ -335,7 +350,7 @@ class GlobalBeliefModel(BeliefModel):
                     continue
                 
                 count = current_counts.get(val, 0) + 1
-                if count > self.config.get_copies(val):
+                if count > get_copies(val):
                     continue
                 
                 current_counts[val] = count
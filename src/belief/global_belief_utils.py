@@ -1,4 +1,5 @@
 from typing import Dict, Set, List, Tuple, Optional, Union
+from bisect import bisect_left
 import collections
 
 
@@ -55,6 +56,19 @@ def generate_signatures_worker(
     # Prepare for recursion
     current_hand = [None] * hand_size
     
+    # Restrict each position's domain up front: sorted indices of the values the
+    # beliefs still allow there (not-present, reveals, swaps are already applied)
+    allowed_indices = [
+        sorted(val_to_idx[v] for v in player_beliefs[pos] if v in val_to_idx)
+        for pos in range(hand_size)
+    ]
+    # Only this player's constraints matter; select them once instead of per hand
+    my_adjacent = [
+        (p1, p2, is_equal) for (pid, p1, p2), is_equal in adjacent_constraints.items()
+        if pid == player_id and p1 < hand_size and p2 < hand_size
+    ]
+    my_copy_counts = [(p, req_count) for (pid, p), req_count in copy_count_constraints.items() if pid == player_id]
+    
     def backtrack(pos: int, min_val_idx: int, current_counts: Dict[int, int]):
         # Pruning: Check if we can still satisfy min_counts
         remaining_slots = hand_size - pos
@@ -72,24 +86,20 @@ def generate_signatures_worker(
             # Hand complete - validate all constraints before adding
             
             # Check adjacent constraints
-            for (pid, p1, p2), is_equal in adjacent_constraints.items():
-                if pid == player_id:
-                    # Ensure positions are within the hand we're building
-                    if p1 < hand_size and p2 < hand_size:
-                        val1 = current_hand[p1]
-                        val2 = current_hand[p2]
-                        if is_equal and val1 != val2:
-                            return  # Constraint violated
-                        if not is_equal and val1 == val2:
-                            return  # Constraint violated
+            for p1, p2, is_equal in my_adjacent:
+                val1 = current_hand[p1]
+                val2 = current_hand[p2]
+                if is_equal and val1 != val2:
+                    return  # Constraint violated
+                if not is_equal and val1 == val2:
+                    return  # Constraint violated
             
             # Check copy count constraints
-            for (pid, p), req_count in copy_count_constraints.items():
-                if pid == player_id:
-                    val = current_hand[p]
-                    v_idx = val_to_idx[val]
-                    if current_counts.get(v_idx, 0) != req_count:
-                        return
+            for p, req_count in my_copy_counts:
+                val = current_hand[p]
+                v_idx = val_to_idx[val]
+                if current_counts.get(v_idx, 0) != req_count:
+                    return
 
             # Convert counts to signature vector
             sig = [0] * K
@@ -103,16 +113,12 @@ def generate_signatures_worker(
         # Must be in beliefs[pos]
         # Count must not exceed global total
         
-        possible_values = player_beliefs[pos]
+        allowed = allowed_indices[pos]
         
-        # Iterate through sorted values starting from min_val_idx
-        for v_idx in range(min_val_idx, K):
+        # Iterate through the allowed values starting from min_val_idx
+        for v_idx in allowed[bisect_left(allowed, min_val_idx):]:
             val = sorted_values[v_idx]
             
-            # Check if value is allowed at this position
-            if val not in possible_values:
-                continue
-            
             # Check global count constraint
             # Use wire_distribution directly or passed config
             # Assuming wire_distribution maps value -> total copies
@@ -244,6 +244,34 @@ class ValueTracker:
         self.certain: List[Tuple[int, int]] = []   # [(player_id, position), ...]
         self.called: List[int] = []                # [player_id, ...] - position unknown
     
+    @property
+    def revealed(self) -> List[Tuple[int, int]]:
+        """
+        Revealed (player_id, position) pairs, in reveal order.
+        
+        Assigning a new list also rebuilds the lookup set used by is_revealed().
+        Mutate through add_revealed() so the two stay in sync.
+        """
+        return self._revealed
+    
+    @revealed.setter
+    def revealed(self, positions: List[Tuple[int, int]]):
+        self._revealed = positions
+        self._revealed_set = set(positions)
+    
+    def is_revealed(self, player_id: int, position: int) -> bool:
+        """
+        Check whether a player's position has revealed this value.
+        
+        Args:
+            player_id: The player to check
+            position: The position to check
+            
+        Returns:
+            True if (player_id, position) is in the revealed list
+        """
+        return (player_id, position) in self._revealed_set
+    
     @property
     def uncertain(self) -> int:
         """
@@ -298,8 +326,9 @@ class ValueTracker:
             self.called.remove(player_id)
         
         # Add to revealed if not already there
-        if (player_id, position) not in self.revealed:
-            self.revealed.append((player_id, position))
+        if (player_id, position) not in self._revealed_set:
+            self._revealed.append((player_id, position))
+            self._revealed_set.add((player_id, position))
         else:
             print(f"XX Warning: Player {player_id} position {position} already in revealed list for value {self.value}")
     
@@ -313,7 +342,7 @@ class ValueTracker:
             position: The position that is certain
         """
         # Skip if this position is already revealed or certain
-        if (player_id, position) in self.revealed or (player_id, position) in self.certain:
+        if (player_id, position) in self._revealed_set or (player_id, position) in self.certain:
             return
         
         # Remove player from called if present (now we know the position)
@@ -416,16 +445,17 @@ class ValueTracker:
         
         # revealed: convert to list of tuples
         revealed_data = data.get("revealed", [])
-        vt.revealed = []
+        revealed = []
         for item in revealed_data:
             if isinstance(item, (list, tuple)) and len(item) == 2:
                 # Format: [player_identifier, position]
                 player_id = parse_player(item[0])
                 position = int(item[1])
-                vt.revealed.append((player_id, position))
+                revealed.append((player_id, position))
             elif isinstance(item, int):
                 # Old format: just player_id (position unknown, treat as invalid/skip)
                 pass
+        vt.revealed = revealed
         
         # certain: convert to list of tuples
         certain_data = data.get("certain", [])
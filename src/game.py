@@ -3,6 +3,7 @@ Game class manages the game state, enforces rules, and coordinates player action
 This is the central orchestrator for BombBuster gameplay.
 """
 
+from dataclasses import asdict
 from typing import List, Optional, Dict, Union, Tuple
 from src.data_structures import CallRecord, DoubleRevealRecord, SwapRecord, SignalRecord, NotPresentRecord, SignalCopyCountRecord, SignalAdjacentRecord, GameObservation
 from src.player import Player
@@ -30,6 +31,7 @@ class Game:
         call_history: List of all calls made (public information)
         current_turn: Current turn number
         wrong_calls_count: Number of wrong calls made (lose if >= max_wrong_calls)
+        max_wrong_calls: Copy of config.max_wrong_calls (fixed for the game)
         game_over: Whether the game has ended
         team_won: True if team won, False if team lost, None if game ongoing
     """
@@ -54,8 +56,13 @@ class Game:
         self.adjacent_signal_history: List[SignalAdjacentRecord] = []
         self.has_values_history: List[Tuple[int, Union[int, float]]] = [] # (player_id, value)
         
+        # JSON-ready (asdict) copies of the histories, filled as records are added
+        # so saving a game log does not convert every record at the end
+        self.serialized_history: Dict[str, List[Dict]] = self._empty_serialized_history()
+        
         self.current_turn = 0
         self.wrong_calls_count = 0
+        self.max_wrong_calls = config.max_wrong_calls
         self.game_over = False
         self.team_won: Optional[bool] = None
         
@@ -164,6 +171,7 @@ class Game:
         
         # Add to history
         self.call_history.append(call_record)
+        self.serialized_history["calls"].append(asdict(call_record))
         
         # Update wrong calls count if unsuccessful
         # if not success:
@@ -172,6 +180,12 @@ class Game:
         # Broadcast to all players
         self._broadcast_call(call_record)
         
+        # Keep the players' unrevealed-position indexes in sync
+        if success:
+            self.players[target_id].mark_revealed(position, value)
+            if caller_position is not None:
+                self.players[caller_id].mark_revealed(caller_position, value)
+        
         # Check win/loss conditions
         self._check_win_condition()
         
@@ -210,10 +224,15 @@ class Game:
         )
         
         self.double_reveal_history.append(reveal_record)
+        self.serialized_history["double_reveals"].append(asdict(reveal_record))
         
         # Broadcast to all players
         self._broadcast_double_reveal(reveal_record)
         
+        # Keep the player's unrevealed-position index in sync
+        self.players[player_id].mark_revealed(position1, value)
+        self.players[player_id].mark_revealed(position2, value)
+        
         # Check win condition
         self._check_win_condition()
         
@@ -250,6 +269,7 @@ class Game:
         )
         
         self.signal_history.append(signal_record)
+        self.serialized_history["signals"].append(asdict(signal_record))
         
         # Broadcast to all players
         self._broadcast_signal(signal_record)
@@ -290,10 +310,14 @@ class Game:
         )
         
         self.reveal_history.append(reveal_record)
+        self.serialized_history["reveals"].append(asdict(reveal_record))
         
         # Broadcast to all players (use reveal processing)
         self._broadcast_reveal(reveal_record)
         
+        # Keep the player's unrevealed-position index in sync
+        self.players[player_id].mark_revealed(position, value)
+        
         # Check win condition
         self._check_win_condition()
         
@@ -421,6 +445,7 @@ class Game:
         )
         
         self.not_present_history.append(not_present_record)
+        self.serialized_history["not_present"].append(asdict(not_present_record))
         
         # Broadcast to all players
         self._broadcast_not_present(not_present_record)
@@ -461,6 +486,7 @@ class Game:
         )
         
         self.copy_count_signal_history.append(signal_record)
+        self.serialized_history["copy_count_signals"].append(asdict(signal_record))
         
         # Broadcast to all players
         self._broadcast_copy_count(signal_record)
@@ -502,6 +528,7 @@ class Game:
         )
         
         self.adjacent_signal_history.append(signal_record)
+        self.serialized_history["adjacent_signals"].append(asdict(signal_record))
         
         # Broadcast to all players
         self._broadcast_adjacent(signal_record)
@@ -561,7 +588,7 @@ class Game:
         # When not in IRL mode, validate that the player actually has this value
         if not self.config.playing_irl:
             player = self.players[player_id]
-            if value not in player.wire:
+            if not player.has_value(value):
                 raise ValueError(f"Player {player_id} cannot announce having value {value} - they don't possess it")
     
     def _broadcast_has_value(self, player_id: int, value: Union[int, float]):
@@ -577,6 +604,21 @@ class Game:
             if player.belief_system is not None:
                 player.belief_system.process_has_value(player_id, value)
     
+    def eliminate_value(self, target_id: int, value: Union[int, float], positions: Tuple[int, ...]):
+        """
+        Remove a value from the given positions of a player in every belief system.
+        Used when a double chance fails: neither called position holds the value.
+        Unlike announce_not_present this records no history entry.
+        
+        Args:
+            target_id: ID of the player whose positions are eliminated
+            value: The value known to be absent from those positions
+            positions: Wire positions (0-indexed) that cannot hold the value
+        """
+        for player in self.players:
+            if player.belief_system is not None:
+                player.belief_system.bulk_discard(target_id, positions, value)
+    
     def _validate_not_present(self, player_id: int, value: Union[int, float], position: Optional[int] = None):
         """
         Validate that a not-present announcement is legal according to game rules.
@@ -613,7 +655,7 @@ class Game:
                 if player.wire[position] == value:
                     raise ValueError(f"Player {player_id} cannot announce not having value {value} at pos {position} - they have it")
             else:
-                if value in player.wire:
+                if player.has_value(value):
                     raise ValueError(f"Player {player_id} cannot announce not having value {value} - they possess it")
     
     def _validate_copy_count_signal(self, player_id: int, position: int, copy_count: int):
@@ -865,10 +907,15 @@ class Game:
         )
         
         self.swap_history.append(swap_record)
+        self.serialized_history["swaps"].append(asdict(swap_record))
         
         # Broadcast to all players
         self._broadcast_swap(swap_record)
         
+        # Wires were rearranged, so rebuild the unrevealed-position indexes
+        player1.rebuild_unrevealed_index()
+        player2.rebuild_unrevealed_index()
+        
         # Check win condition
         self._check_win_condition()
         
@@ -1022,7 +1069,7 @@ class Game:
         LOSE: wrong_calls_count >= max_wrong_calls
         """
         # Check loss condition first
-        if self.wrong_calls_count >= self.config.max_wrong_calls:
+        if self.wrong_calls_count >= self.max_wrong_calls:
             self.game_over = True
             self.team_won = False
             return
@@ -1064,7 +1111,7 @@ class Game:
         Returns:
             Number of wrong calls remaining before game over
         """
-        return max(0, self.config.max_wrong_calls - self.wrong_calls_count)
+        return max(0, self.max_wrong_calls - self.wrong_calls_count)
     
     def get_game_state(self) -> Dict:
         """
@@ -1088,6 +1135,39 @@ class Game:
             'total_calls': len(self.call_history)
         }
     
+    @staticmethod
+    def _empty_serialized_history() -> Dict[str, List[Dict]]:
+        """Create the empty per-action-type lists for serialized_history."""
+        return {
+            "calls": [],
+            "double_reveals": [],
+            "swaps": [],
+            "signals": [],
+            "reveals": [],
+            "not_present": [],
+            "copy_count_signals": [],
+            "adjacent_signals": []
+        }
+    
+    def get_action_history(self) -> Dict[str, List]:
+        """
+        Get the full action history in the JSON format used by action_history.json.
+        
+        Returns:
+            Dict mapping action type to its list of serialized records
+        """
+        return {
+            "calls": self.serialized_history["calls"],
+            "double_reveals": self.serialized_history["double_reveals"],
+            "swaps": self.serialized_history["swaps"],
+            "signals": self.serialized_history["signals"],
+            "reveals": self.serialized_history["reveals"],
+            "not_present": self.serialized_history["not_present"],
+            "has_values": self.has_values_history,
+            "copy_count_signals": self.serialized_history["copy_count_signals"],
+            "adjacent_signals": self.serialized_history["adjacent_signals"]
+        }
+    
     def get_observation_for_player(self, player_id: int) -> GameObservation:
         """
         Get the observation (available information) for a specific player.
@@ -1134,6 +1214,7 @@ class Game:
         Useful for playing multiple games in sequence.
         """
         self.call_history = []
+        self.serialized_history = self._empty_serialized_history()
         self.current_turn = 0
         self.wrong_calls_count = 0
         self.game_over = False
@@ -1141,3 +1222,7 @@ class Game:
         
         # Reinitialize belief systems
         self._initialize_belief_systems()
+        
+        # The fresh value trackers have nothing revealed, so re-index every position
+        for player in self.players:
+            player.rebuild_unrevealed_index()
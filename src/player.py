@@ -28,6 +28,9 @@ class Player:
         revealed_positions: Dict mapping position to value for visible positions
         belief_system: BeliefModel tracking all players' possible values
         config: Game configuration
+        positions_by_value: Dict mapping each value to all sorted wire positions holding it
+        unrevealed_by_value: Dict mapping each value to the sorted wire positions
+                             holding it that have not been revealed yet
     """
     
     def __init__(self, player_id: int, wire: Optional[List[Union[int, float]]], config: GameConfig):
@@ -56,6 +59,58 @@ class Player:
         self.config = config
         self.revealed_positions: Dict[int, Union[int, float]] = {}
         self.belief_system: Optional[BeliefModel] = None  # Initialized by Game
+        self.positions_by_value: Dict[Union[int, float], List[int]] = {}
+        self.unrevealed_by_value: Dict[Union[int, float], List[int]] = {}
+        self.rebuild_unrevealed_index()
+    
+    def rebuild_unrevealed_index(self):
+        """
+        Rebuild the value -> positions indexes from the wire.
+        
+        positions_by_value lists every position; unrevealed_by_value skips positions
+        already revealed in this player's own value trackers.
+        Called at construction and whenever the wire is rearranged (e.g. swaps).
+        """
+        self.positions_by_value = {}
+        self.unrevealed_by_value = {}
+        if self.wire is None:
+            return
+        
+        value_trackers = self.belief_system.value_trackers if self.belief_system is not None else {}
+        for pos, val in enumerate(self.wire):
+            self.positions_by_value.setdefault(val, []).append(pos)
+            tracker = value_trackers.get(val)
+            if tracker is not None and tracker.is_revealed(self.player_id, pos):
+                continue
+            self.unrevealed_by_value.setdefault(val, []).append(pos)
+    
+    def mark_revealed(self, position: int, value: Union[int, float]):
+        """
+        Drop a newly revealed position from the unrevealed index.
+        
+        No-op if the wire is unknown or the position does not hold the value
+        (e.g. IRL play where the simulated wire does not match the physical one).
+        
+        Args:
+            position: The wire position that was revealed
+            value: The value revealed at that position
+        """
+        bucket = self.unrevealed_by_value.get(value)
+        if bucket and position in bucket:
+            bucket.remove(position)
+    
+    def first_unrevealed_position(self, value: Union[int, float]) -> Optional[int]:
+        """
+        Get the first position holding the value that has not been revealed yet.
+        
+        Args:
+            value: The value to search for
+            
+        Returns:
+            The lowest such position, or None if there is none
+        """
+        bucket = self.unrevealed_by_value.get(value)
+        return bucket[0] if bucket else None
     
     
     def has_value(self, value: int) -> bool:
@@ -73,7 +128,7 @@ class Player:
         """
         if self.wire is None:
             raise ValueError("Wire not available (real-life mode). Players track their own values.")
-        return value in self.wire
+        return value in self.positions_by_value
     
     def has_won(self) -> bool:
         """
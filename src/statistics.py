@@ -179,12 +179,7 @@ class GameStatistics:
         if self.my_wire is not None:
             # If we know the wire, check each position
             for pos, val in enumerate(self.my_wire):
-                is_revealed = False
-                if val in value_trackers:
-                    for pid, r_pos in value_trackers[val].revealed:
-                        if pid == self.my_player_id and r_pos == pos:
-                            is_revealed = True
-                            break
+                is_revealed = val in value_trackers and value_trackers[val].is_revealed(self.my_player_id, pos)
                 if not is_revealed:
                     playable_values.add(val)
         else:
@@ -193,12 +188,7 @@ class GameStatistics:
                 beliefs = self.belief_model.beliefs[self.my_player_id][pos]
                 if len(beliefs) == 1:
                     val = list(beliefs)[0]
-                    is_revealed = False
-                    if val in value_trackers:
-                        for pid, r_pos in value_trackers[val].revealed:
-                            if pid == self.my_player_id and r_pos == pos:
-                                is_revealed = True
-                                break
+                    is_revealed = val in value_trackers and value_trackers[val].is_revealed(self.my_player_id, pos)
                     if not is_revealed:
                         playable_values.add(val)
         
@@ -224,9 +214,8 @@ class GameStatistics:
         if len(beliefs) == 1:
             val = list(beliefs)[0]
             if val in self.belief_model.value_trackers:
-                for pid, r_pos in self.belief_model.value_trackers[val].revealed:
-                    if pid == player_id and r_pos == position:
-                        return True
+                if self.belief_model.value_trackers[val].is_revealed(player_id, position):
+                    return True
         
         # If belief is not certain, it can't be revealed (revealed implies certain)
         # Unless there's some inconsistency, but let's assume consistency.
@@ -3,13 +3,27 @@ Utility functions for BombBuster game setup.
 Handles wire distribution, game utilities, and IRL gameplay helpers.
 """
 
+import os
+import sys
 import random
 import json
+from itertools import repeat
 from typing import List, Union, Dict, Tuple, Optional
 from pathlib import Path
 from config.game_config import GameConfig, USE_VOID_PLAYER, EXTRA_UNCERTAIN_WIRES, PLAYER_NAMES
 from src.statistics import GameStatistics
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+# Parser for saved state files (orjson is a drop-in, faster json.loads)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Set BB_QUIET=1 to skip the IRL report printers (e.g. when the output is not read)
+QUIET = os.environ.get("BB_QUIET") == "1"
+
 
 def find_first_unrevealed_position(player, value: Union[int, float]) -> Optional[int]:
     """
@@ -25,6 +39,10 @@ def find_first_unrevealed_position(player, value: Union[int, float]) -> Optional
     """
     if player.wire is None:
         return None
+    
+    # Players keep an incrementally maintained index of unrevealed positions
+    if hasattr(player, 'first_unrevealed_position'):
+        return player.first_unrevealed_position(value)
         
     value_tracker = None
     if hasattr(player, 'belief_system') and player.belief_system is not None:
@@ -33,14 +51,7 @@ def find_first_unrevealed_position(player, value: Union[int, float]) -> Optional
     for pos, val in enumerate(player.wire):
         if val == value:
             # Check if this position is revealed
-            is_revealed = False
-            if value_tracker:
-                for revealed_pid, revealed_pos in value_tracker.revealed:
-                    if revealed_pid == player.player_id and revealed_pos == pos:
-                        is_revealed = True
-                        break
-            
-            if not is_revealed:
+            if value_tracker is None or not value_tracker.is_revealed(player.player_id, pos):
                 return pos
                 
     return None
@@ -131,20 +142,14 @@ def generate_wires(config: GameConfig, seed: int = None) -> List[List[Union[int,
     # Create full deck
     deck = []
     for value in config.wire_values:
-        copies = config.get_copies(value)
-        deck.extend([value] * copies)
+        deck.extend(repeat(value, config.get_copies(value)))
     
-    # Shuffle and deal
+    # Shuffle and deal (each hand is a fresh sorted list, so players never share storage)
     random.shuffle(deck)
     
-    wires = []
-    for i in range(config.n_players):
-        start_idx = i * config.wires_per_player
-        end_idx = start_idx + config.wires_per_player
-        wire = sorted(deck[start_idx:end_idx])
-        wires.append(wire)
-    
-    return wires
+    hand_size = config.wires_per_player
+    return [sorted(deck[start:start + hand_size])
+            for start in range(0, config.n_players * hand_size, hand_size)]
 
 
 def print_all_wires(wires: List[List[Union[int, float]]]):
@@ -175,11 +180,11 @@ def _parse_player_id(player_identifier: Union[str, int], player_names: Dict[int,
     if isinstance(player_identifier, int):
         return player_identifier
     
-    # Create reverse mapping (name -> ID) if needed
+    # Look the name up directly (no reverse dict built per call)
     if player_names:
-        name_to_id = {name: pid for pid, name in player_names.items()}
-        if player_identifier in name_to_id:
-            return name_to_id[player_identifier]
+        for pid, name in player_names.items():
+            if name == player_identifier:
+                return pid
     
     # Try to parse as integer
     try:
@@ -484,6 +489,89 @@ def format_call_for_user(call_record, player_names: Dict[int, str] = None) -> st
     return f"{caller_name} → {target_name}[{position_user}] = {call_record.value} [{result}]"
 
 
+def apply_irl_action(game, action_type: str, action: Tuple, player_names: Dict[int, str] = None,
+                     my_player_id: int = None):
+    """
+    Apply a single user-format IRL action to a game.
+    
+    Args:
+        game: The Game to update
+        action_type: One of "call", "double_reveal", "swap", "signal", "reveal",
+                     "not_present", "has_value", "copy_count_signal", "adjacent_signal"
+        action: The action tuple in the same format as the session lists
+        player_names: Optional dict mapping player IDs to names
+        my_player_id: Your player ID (needed to normalize swaps)
+        
+    Returns:
+        The record produced by the game (a description string for has-value),
+        or None if a copy-count/adjacent signal is malformed and was skipped
+        
+    Raises:
+        ValueError: If the action is invalid
+    """
+    if action_type == "call":
+        caller, target, pos, val, success, caller_pos = convert_call_to_internal(action, player_names)
+        return game.make_call(caller, target, pos, val, success, caller_pos)
+    
+    if action_type == "double_reveal":
+        player, val, pos1, pos2 = convert_double_reveal_to_internal(action, player_names)
+        return game.double_reveal(player, val, pos1, pos2)
+    
+    if action_type == "swap":
+        p1, p2, init1, init2, final1, final2, received_value = convert_swap_to_internal(action, player_names, my_player_id)
+        
+        # Normalize: In IRL mode, always put the IRL player (my_player_id) as player1
+        # This simplifies the logic in belief_model.py
+        if received_value is not None:
+            if p2 == my_player_id:
+                # Swap players and positions so IRL player is always player1
+                p1, p2 = p2, p1
+                init1, init2 = init2, init1
+                final1, final2 = final2, final1
+                # received_value stays the same - it's what the IRL player receives
+            
+            # Now IRL player is always player1
+            return game.swap_wires(p1, p2, init1, init2, final1, final2,
+                                   player1_received_value=received_value)
+        # Simulation mode - no normalization needed
+        return game.swap_wires(p1, p2, init1, init2, final1, final2)
+    
+    if action_type == "signal":
+        player, val, pos = convert_signal_to_internal(action, player_names)
+        return game.signal_value(player, val, pos)
+    
+    if action_type == "reveal":
+        # Same format as signal
+        player, val, pos = convert_signal_to_internal(action, player_names)
+        return game.reveal_value(player, val, pos)
+    
+    if action_type == "not_present":
+        player, val, pos = convert_not_present_to_internal(action, player_names)
+        return game.announce_not_present(player, val, pos)
+    
+    if action_type == "has_value":
+        player, val = convert_has_value_to_internal(action, player_names)
+        # Note: announce_has_value doesn't return a record, but we track it anyway
+        game.announce_has_value(player, val)
+        return f"Player {player} has value {val}"
+    
+    if action_type == "copy_count_signal":
+        # Format: (player_name/id, position_0indexed, copy_count)
+        if isinstance(action, tuple) and len(action) >= 3:
+            player_id = _parse_player_id(action[0], player_names)
+            return game.signal_copy_count(int(player_id), action[1], action[2])
+        return None
+    
+    if action_type == "adjacent_signal":
+        # Format: (player_name/id, pos1_0indexed, pos2_0indexed, is_equal)
+        if isinstance(action, tuple) and len(action) >= 4:
+            player_id = _parse_player_id(action[0], player_names)
+            return game.signal_adjacent(int(player_id), action[1], action[2], action[3])
+        return None
+    
+    raise ValueError(f"Unknown action type: {action_type}")
+
+
 def save_action_history(belief_folder: str, player_id: int, 
                        calls: List[Tuple], double_reveals: List[Tuple],
                        swaps: List[Tuple], signals: List[Tuple],
@@ -534,8 +622,11 @@ def save_action_history(belief_folder: str, player_id: int,
         "adjacent_signals": adjacent_signals
     }
     
-    with history_file.open("w", encoding="utf-8") as fh:
-        json.dump(history_data, fh, indent=2)
+    # Serialize in memory and write once, compactly; orjson (if installed) encodes in C
+    if orjson is not None:
+        history_file.write_bytes(orjson.dumps(history_data))
+    else:
+        history_file.write_text(json.dumps(history_data, separators=(",", ":")), encoding="utf-8")
 
 
 def load_action_history(belief_folder: str, player_id: int) -> Optional[Dict]:
@@ -557,8 +648,7 @@ def load_action_history(belief_folder: str, player_id: int) -> Optional[Dict]:
     if not history_file.exists():
         return None
     
-    with history_file.open("r", encoding="utf-8") as fh:
-        return json.load(fh)
+    return _json_loads(history_file.read_bytes())
 
 
 def get_new_actions(old_actions: List, new_actions: List) -> List:
@@ -645,6 +735,8 @@ def run_irl_game_session(
             f"MY_WIRE has {len(my_wire)} values, but config expects {config.wires_per_player}. "
             f"Please update MY_WIRE or modify WIRE_DISTRIBUTION in config/game_config.py"
         )
+    if not 0 <= my_player_id < config.n_players:
+        raise ValueError(f"Invalid my_player_id: {my_player_id}. Must be in [0, {config.n_players - 1}]")
     
     # Generate dummy wires for other players
     all_wires = generate_wires(config, seed=42)
@@ -666,6 +758,24 @@ def run_irl_game_session(
     belief_path = Path(belief_folder)
     belief_file = belief_path / f"player_{my_player_id}" / "belief.json"
     
+    # The saved state is only a valid starting point if every action it covers
+    # is still listed; if any list got shorter (an action was removed), replay
+    # everything from scratch and overwrite the saved files
+    old_history = None
+    if save_to_json and load_from_json:
+        old_history = load_action_history(belief_folder, my_player_id)
+        if old_history is not None:
+            current_lengths = {
+                "calls": len(calls), "double_reveals": len(double_reveals), "swaps": len(swaps),
+                "signals": len(signals), "reveals": len(reveals), "not_present": len(not_present),
+                "has_values": len(has_values), "copy_count_signals": len(copy_count_signals),
+                "adjacent_signals": len(adjacent_signals),
+            }
+            if any(len(old_history.get(key, [])) > n for key, n in current_lengths.items()):
+                print("\n⚠️  Saved action history lists actions that were removed; replaying from scratch")
+                old_history = None
+                load_from_json = False
+    
     loaded_from_file = False
     if load_from_json and belief_file.exists():
         my_player = players[my_player_id]
@@ -689,6 +799,7 @@ def run_irl_game_session(
             config
         )
         my_player.belief_system = loaded_belief
+        my_player.rebuild_unrevealed_index()
         loaded_from_file = True
 
     
@@ -703,10 +814,11 @@ def run_irl_game_session(
     copy_count_signals_to_process = copy_count_signals
     adjacent_signals_to_process = adjacent_signals
     processed_incrementally = False
+    # True when the saved state already covers every action passed in
+    up_to_date = False
     
     # If both save and load are enabled, only process new actions
     if save_to_json and load_from_json and loaded_from_file:
-        old_history = load_action_history(belief_folder, my_player_id)
         if old_history is not None:
             # Only process actions that are new since last save
             calls_to_process = get_new_actions(old_history.get("calls", []), calls)
@@ -729,6 +841,7 @@ def run_irl_game_session(
                       f"{len(not_present_to_process)} not-present, {len(has_values_to_process)} has-values, "
                       f"{len(copy_count_signals_to_process)} copy-count, {len(adjacent_signals_to_process)} adjacent")
             else:
+                up_to_date = True
                 print(f"\n✓ No new actions to process")
 
             # CRITICAL: Replay old swaps to ensure player's wire is up to date
@@ -778,144 +891,26 @@ def run_irl_game_session(
     copy_count_signal_records = []
     adjacent_signal_records = []
     
-    for call in calls_to_process:
-        try:
-            # Convert call to internal format
-            internal_call = convert_call_to_internal(call, player_names)
-            caller, target, pos, val, success, caller_pos = internal_call
-            
-            call_record = game.make_call(caller, target, pos, val, success, caller_pos)
-            call_records.append(call_record)
-        except ValueError as e:
-            call_records.append(f"ERROR: {e}")
-    
-    # Process double reveals
-    for reveal in double_reveals_to_process:
-        try:
-            # Convert reveal to internal format
-            internal_reveal = convert_double_reveal_to_internal(reveal, player_names)
-            player, val, pos1, pos2 = internal_reveal
-            
-            reveal_record = game.double_reveal(player, val, pos1, pos2)
-            double_reveal_records.append(reveal_record)
-        except ValueError as e:
-            double_reveal_records.append(f"ERROR: {e}")
-    
-    # Process swaps
-    for swap in swaps_to_process:
-        try:
-            # Convert swap to internal format
-            internal_swap = convert_swap_to_internal(swap, player_names, my_player_id)
-            p1, p2, init1, init2, final1, final2, received_value = internal_swap
-            
-            # Normalize: In IRL mode, always put the IRL player (my_player_id) as player1
-            # This simplifies the logic in belief_model.py
-            if received_value is not None:
-                if p2 == my_player_id:
-                    # Swap players and positions so IRL player is always player1
-                    p1, p2 = p2, p1
-                    init1, init2 = init2, init1
-                    final1, final2 = final2, final1
-                    # received_value stays the same - it's what the IRL player receives
-                
-                # Now IRL player is always player1
-                swap_record = game.swap_wires(p1, p2, init1, init2, final1, final2, 
-                                             player1_received_value=received_value)
-            else:
-                # Simulation mode - no normalization needed
-                swap_record = game.swap_wires(p1, p2, init1, init2, final1, final2)
-            
-            swap_records.append(swap_record)
-        except ValueError as e:
-            swap_records.append(f"ERROR: {e}")
-    
-    # Process signals
-    for signal in signals_to_process:
-        try:
-            # Convert signal to internal format
-            internal_signal = convert_signal_to_internal(signal, player_names)
-            player, val, pos = internal_signal
-            
-            signal_record = game.signal_value(player, val, pos)
-            signal_records.append(signal_record)
-        except ValueError as e:
-            signal_records.append(f"ERROR: {e}")
-    
-    # Process reveals
-    for reveal in reveals_to_process:
-        try:
-            # Convert reveal to internal format (same format as signal)
-            internal_reveal = convert_signal_to_internal(reveal, player_names)
-            player, val, pos = internal_reveal
-            
-            reveal_record = game.reveal_value(player, val, pos)
-            reveal_records.append(reveal_record)
-        except ValueError as e:
-            reveal_records.append(f"ERROR: {e}")
-    
-    # Process not-present announcements
-    for np in not_present_to_process:
-        try:
-            # Convert not-present to internal format
-            internal_np = convert_not_present_to_internal(np, player_names)
-            player, val, pos = internal_np
-            
-            np_record = game.announce_not_present(player, val, pos)
-            not_present_records.append(np_record)
-        except ValueError as e:
-            not_present_records.append(f"ERROR: {e}")
-            
-    # Process has-value announcements
-    for hv in has_values_to_process:
-        try:
-            # Convert has-value to internal format
-            internal_hv = convert_has_value_to_internal(hv, player_names)
-            player, val = internal_hv
-            
-            # Note: announce_has_value doesn't return a record, but we track it anyway
-            game.announce_has_value(player, val)
-            has_value_records.append(f"Player {player} has value {val}")
-        except ValueError as e:
-            has_value_records.append(f"ERROR: {e}")
-    
-    # Process copy count signals
-    for ccs in copy_count_signals_to_process:
-        try:
-            # Format: (player_name/id, position_0indexed, copy_count)
-            if isinstance(ccs, tuple) and len(ccs) >= 3:
-                # Create reverse mapping (name -> ID) if needed
-                player_id = ccs[0]
-                if isinstance(player_id, str) and player_names:
-                    name_to_id = {name: pid for pid, name in player_names.items()}
-                    player_id = name_to_id.get(player_id, int(player_id))
-                
-                position = ccs[1]
-                copy_count = ccs[2]
-                
-                record = game.signal_copy_count(int(player_id), position, copy_count)
-                copy_count_signal_records.append(record)
-        except ValueError as e:
-            copy_count_signal_records.append(f"ERROR: {e}")
-    
-    # Process adjacent signals
-    for adj in adjacent_signals_to_process:
-        try:
-            # Format: (player_name/id, pos1_0indexed, pos2_0indexed, is_equal)
-            if isinstance(adj, tuple) and len(adj) >= 4:
-                # Create reverse mapping (name -> ID) if needed
-                player_id = adj[0]
-                if isinstance(player_id, str) and player_names:
-                    name_to_id = {name: pid for pid, name in player_names.items()}
-                    player_id = name_to_id.get(player_id, int(player_id))
-                
-                pos1 = adj[1]
-                pos2 = adj[2]
-                is_equal = adj[3]
-                
-                record = game.signal_adjacent(int(player_id), pos1, pos2, is_equal)
-                adjacent_signal_records.append(record)
-        except ValueError as e:
-            adjacent_signal_records.append(f"ERROR: {e}")
+    # Actions are applied grouped by kind, in this order
+    batches = (
+        ("call", calls_to_process, call_records),
+        ("double_reveal", double_reveals_to_process, double_reveal_records),
+        ("swap", swaps_to_process, swap_records),
+        ("signal", signals_to_process, signal_records),
+        ("reveal", reveals_to_process, reveal_records),
+        ("not_present", not_present_to_process, not_present_records),
+        ("has_value", has_values_to_process, has_value_records),
+        ("copy_count_signal", copy_count_signals_to_process, copy_count_signal_records),
+        ("adjacent_signal", adjacent_signals_to_process, adjacent_signal_records),
+    )
+    for action_type, actions, records in batches:
+        for action in actions:
+            try:
+                record = apply_irl_action(game, action_type, action, player_names, my_player_id)
+                if record is not None:
+                    records.append(record)
+            except ValueError as e:
+                records.append(f"ERROR: {e}")
     
     # Get game state
     state = game.get_game_state()
@@ -927,7 +922,9 @@ def run_irl_game_session(
     # if my_player.belief_system is not None:
     #     my_player.belief_system.apply_filters()
         
-    if save_to_json and my_player.belief_system is not None:
+    # Nothing was processed on top of the loaded state and no list got shorter,
+    # so the files on disk are current
+    if save_to_json and my_player.belief_system is not None and not up_to_date:
         try:
             my_player.belief_system.save_to_folder(belief_folder, player_names)
             # Also save action history to enable incremental processing
@@ -985,26 +982,33 @@ def print_player_setup(players, my_player_id: int, player_names: Dict[int, str]
 
 def print_call_history(call_records, player_names: Dict[int, str] = None, only_recent: bool = False):
     """Print formatted call history."""
-    print(f"\n" + "="*80)
+    if QUIET:
+        return
+    # Collect the whole report and write it once instead of one print per record
+    lines = ["\n" + "="*80]
     if only_recent and call_records:
-        print("RECENTLY PROCESSED ACTIONS")
+        lines.append("RECENTLY PROCESSED ACTIONS")
     else:
-        print("CALL HISTORY")
-    print("="*80)
+        lines.append("CALL HISTORY")
+    lines.append("="*80)
     
     if not call_records:
-        print("\nNo new actions processed.")
+        lines.append("\nNo new actions processed.")
     else:
         for i, record in enumerate(call_records):
             if isinstance(record, str):  # Error message
-                print(f"\n{i+1}. {record}")
+                lines.append(f"\n{i+1}. {record}")
             else:
                 formatted = format_call_for_user(record, player_names)
-                print(f"\n{i+1}. {formatted}")
+                lines.append(f"\n{i+1}. {formatted}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_game_state(state, config: GameConfig):
     """Print current game state."""
+    if QUIET:
+        return
     print(f"\n" + "="*80)
     print("GAME STATE")
     print("="*80)
@@ -1027,6 +1031,8 @@ def print_game_state(state, config: GameConfig):
 
 def print_player_info(my_player, my_player_id: int, state, player_names: Dict[int, str] = None, config: GameConfig = None):
     """Print your information and call suggestions."""
+    if QUIET:
+        return
     player_name = player_names.get(my_player_id, f"Player {my_player_id}") if player_names else f"Player {my_player_id}"
     
     print(f"\n" + "="*80)
@@ -1044,7 +1050,7 @@ def print_player_info(my_player, my_player_id: int, state, player_names: Dict[in
 
 def print_belief_state(my_player, belief_folder: str, my_player_id: int, player_names: Dict[int, str] = None, config: GameConfig = None):
     """Print belief state, statistics, and save to JSON."""
-    if my_player.belief_system is None:
+    if QUIET or my_player.belief_system is None:
         return
     
     print(f"\n" + "="*80)
@@ -1061,6 +1067,8 @@ def print_belief_state(my_player, belief_folder: str, my_player_id: int, player_
     print(f"   📁 Files: {belief_folder}/player_{my_player_id}/value_tracker.json")
     
 def print_statistics(my_player, player_names: Dict[int, str] = None, config: GameConfig = None):
+    if QUIET:
+        return
     # Print statistics
     stats = GameStatistics(my_player.belief_system, config or my_player.config, my_player.get_wire())
     stats.print_statistics(player_names)
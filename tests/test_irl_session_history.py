@@ -0,0 +1,47 @@
+"""
+Test the incremental IRL session against its saved action history.
+Removing an action must invalidate the saved state, so the actions added
+afterwards are processed instead of being mistaken for already-saved ones.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path so imports work from tests folder
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.game_config import GameConfig
+from src.utils import run_irl_game_session, generate_wires, load_action_history
+
+
+def test_shrunk_history_is_replayed(tmp_path):
+    """Dropping an action and then adding another must match a fresh replay."""
+    config = GameConfig()
+    my_wire = generate_wires(config, seed=3)[0]
+    names = {i: f"P{i}" for i in range(config.n_players)}
+    folder = str(tmp_path / "beliefs")
+
+    def session(calls, **kwargs):
+        return run_irl_game_session(my_wire, 0, calls, config, belief_folder=folder,
+                                    player_names=names, **kwargs)
+
+    call_a = ("P0", "P1", 1, my_wire[0], False)
+    call_b = ("P0", "P2", 1, my_wire[1], False)
+    call_c = ("P0", "P3", 1, my_wire[2], False)
+
+    session([call_a, call_b])
+    assert len(load_action_history(folder, 0)["calls"]) == 2
+
+    # call_b was entered by mistake and removed: the saved state must be rebuilt
+    result = session([call_a])
+    assert not result['loaded_from_file']
+    assert len(load_action_history(folder, 0)["calls"]) == 1
+
+    # The next action is new relative to the rewritten history
+    result = session([call_a, call_c])
+    assert result['processed_incrementally']
+    assert len(result['call_records']) == 1
+    assert len(load_action_history(folder, 0)["calls"]) == 2
+
+    fresh = session([call_a, call_c], save_to_json=False, load_from_json=False)
+    assert result['my_player'].belief_system.beliefs == fresh['my_player'].belief_system.beliefs
@@ -15,8 +15,12 @@ from config.game_config import GameConfig
 import shutil
 
 
-def test_serialization():
-    """Test saving and loading belief models from JSON files."""
+def test_serialization(tmp_path):
+    """Test saving and loading belief models from JSON files.
+    
+    Args:
+        tmp_path: Folder the snapshots are written under (the project root when run as a script)
+    """
     
     print("\n" + "="*80)
     print("TEST: BeliefModel JSON Serialization")
@@ -76,10 +80,9 @@ def test_serialization():
     print("PART 2: Save all belief models to disk")
     print("="*80)
     
-    # Create output folder in project root
-    project_root = Path(__file__).parent.parent
+    # Create output folder
     output_folder = "belief_snapshots"
-    output_path = project_root / output_folder
+    output_path = Path(tmp_path) / output_folder
     
     # Clean up old snapshots if they exist
     if output_path.exists():
@@ -206,4 +209,5 @@ def test_serialization():
 
 
 if __name__ == "__main__":
-    test_serialization()
+    # Keep the snapshots in the project root so they can be inspected and edited
+    test_serialization(Path(__file__).parent.parent)
@@ -0,0 +1,102 @@
+"""
+Test the per-player index of unrevealed positions by value.
+Checks that Player.first_unrevealed_position stays in sync with the
+revealed lists of the player's own value trackers as reveals happen.
+"""
+
+import sys
+from bisect import bisect_left
+from pathlib import Path
+
+# Add parent directory to path so imports work from tests folder
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.player import Player
+from src.game import Game
+from src.utils import generate_wires
+from config.game_config import GameConfig
+
+
+def _scan_first_unrevealed(player, value):
+    """Reference implementation: linear scan of the wire and revealed list."""
+    tracker = player.belief_system.value_trackers[value]
+    for pos, val in enumerate(player.wire):
+        if val == value and (player.player_id, pos) not in tracker.revealed:
+            return pos
+    return None
+
+
+def _assert_index_matches(players, config):
+    for player in players:
+        if player.belief_system is None:
+            continue
+        for value in config.wire_values:
+            assert player.first_unrevealed_position(value) == _scan_first_unrevealed(player, value), \
+                f"Player {player.player_id} value {value}"
+            assert player.positions_by_value.get(value, []) == \
+                [pos for pos, val in enumerate(player.wire) if val == value]
+
+
+def test_unrevealed_index_tracks_reveals():
+    """The index must match a full scan at game start and after a successful call."""
+    config = GameConfig()
+    wires = generate_wires(config, seed=7)
+    players = [Player(i, wires[i], config) for i in range(config.n_players)]
+    game = Game(players, config)
+
+    _assert_index_matches(players, config)
+
+    # Successful call on player 1's first position by someone holding that value
+    target_value = players[1].wire[0]
+    for caller in players:
+        if caller.player_id != 1 and caller.first_unrevealed_position(target_value) is not None:
+            game.auto_make_call(caller.player_id, 1, 0, target_value)
+            break
+
+    _assert_index_matches(players, config)
+    assert players[1].first_unrevealed_position(target_value) != 0
+
+
+def _make_successful_call(game, players, target_id, position):
+    """Call the target's position with its true value from a player who holds it."""
+    target_value = players[target_id].wire[position]
+    for caller in players:
+        if caller.player_id != target_id and caller.first_unrevealed_position(target_value) is not None:
+            game.auto_make_call(caller.player_id, target_id, position, target_value)
+            return target_value
+    return None
+
+
+def test_unrevealed_index_tracks_swaps():
+    """Swapped wires are re-indexed, keeping earlier reveals out of the index."""
+    config = GameConfig()
+    wires = generate_wires(config, seed=7)
+    players = [Player(i, wires[i], config) for i in range(config.n_players)]
+    game = Game(players, config)
+
+    _make_successful_call(game, players, 1, 0)
+    _assert_index_matches(players, config)
+
+    # Exchange the last wires of players 1 and 2, inserting each where it keeps the wire sorted
+    last = config.wires_per_player - 1
+    value1, value2 = players[1].wire[last], players[2].wire[last]
+    final1 = bisect_left(players[1].wire[:last], value2)
+    final2 = bisect_left(players[2].wire[:last], value1)
+    game.swap_wires(1, 2, last, last, final1, final2)
+    assert sorted(players[1].wire) == players[1].wire
+    _assert_index_matches(players, config)
+
+
+def test_unrevealed_index_after_reset():
+    """After a reset nothing is revealed, so every position is back in the index."""
+    config = GameConfig()
+    wires = generate_wires(config, seed=7)
+    players = [Player(i, wires[i], config) for i in range(config.n_players)]
+    game = Game(players, config)
+
+    target_value = _make_successful_call(game, players, 1, 0)
+    assert players[1].first_unrevealed_position(target_value) != 0
+
+    game.reset()
+    _assert_index_matches(players, config)
+    assert players[1].first_unrevealed_position(target_value) == 0